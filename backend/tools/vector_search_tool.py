@@ -12,9 +12,10 @@ from pydantic import BaseModel, Field, field_validator
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from langchain.tools import tool
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_community.vectorstores import FAISS
 
+from vectordb.faiss_store import load_vector_store
+
 
 # Paths
 SCRIPT_DIR = Path(__file__).parent
@@ -127,17 +128,8 @@ def get_vector_store() -> FAISS:
 
     if _vector_store_cache is None:
         try:
-            # Initialize embeddings model
-            embeddings = HuggingFaceEmbeddings(
-                model_name="sentence-transformers/all-MiniLM-L6-v2"
-            )
-
-            # Load FAISS index
-            _vector_store_cache = FAISS.load_local(
-                str(VECTOR_DB_DIR),
-                embeddings,
-                allow_dangerous_deserialization=True
-            )
+            # Load FAISS index (embeddings and metric shared with the builder)
+            _vector_store_cache = load_vector_store(VECTOR_DB_DIR)
         except Exception as e:
             raise Exception(f"Failed to load vector database: {str(e)}")
 
@@ -15,10 +15,16 @@ import pickle
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 
+from vectordb.faiss_store import (
+    EMBEDDING_MODEL_NAME,
+    build_vector_store,
+    choose_index_factory,
+    create_embeddings,
+    normalize_vectors,
+)
+
 
 # Paths configuration
 SCRIPT_DIR = Path(__file__).parent
@@ -261,10 +267,8 @@ def create_vector_database():
 
     # Initialize embeddings model
     print("Initializing embeddings model...")
-    print("  Using: sentence-transformers/all-MiniLM-L6-v2 (default)")
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
-    )
+    print(f"  Using: {EMBEDDING_MODEL_NAME} (normalized, cosine via inner product)")
+    embeddings = create_embeddings()
     print("  ✓ Embeddings model loaded")
     print()
 
@@ -273,10 +277,18 @@ def create_vector_database():
     print(f"Database location: {VECTOR_DB_DIR}")
     print()
 
-    # Create vector store from documents
+    # Embed and L2-normalize all chunks, then index them with inner product
     print("  Processing embeddings (this may take a few minutes)...")
-    vector_store = FAISS.from_documents(all_documents, embeddings)
+    texts = [doc.page_content for doc in all_documents]
+    vectors = normalize_vectors(embeddings.embed_documents(texts))
+    vector_store = build_vector_store(
+        texts,
+        vectors,
+        [doc.metadata for doc in all_documents],
+        embeddings
+    )
     print(f"  ✓ Created embeddings for {len(all_documents)} chunks")
+    print(f"  ✓ Index type: {choose_index_factory(len(all_documents))}")
     print()
 
     # Save vector store
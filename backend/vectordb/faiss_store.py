@@ -0,0 +1,278 @@
+"""
+Shared FAISS vector store settings for building and loading the index.
+Keeps the embedding model and distance metric identical on both sides.
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+import faiss
+from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
+from langchain_core.documents import Document
+
+from vectordb.query_cache import enable_query_cache
+
+
+# Embedding model used for both documents and queries
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+# MiniLM is trained for cosine similarity: unit-length vectors + inner product
+DISTANCE_STRATEGY = DistanceStrategy.MAX_INNER_PRODUCT
+
+# FAISS metric an index must have been built with for each distance strategy
+FAISS_METRICS = {
+    DistanceStrategy.MAX_INNER_PRODUCT: faiss.METRIC_INNER_PRODUCT,
+    DistanceStrategy.EUCLIDEAN_DISTANCE: faiss.METRIC_L2,
+}
+
+# Compressed index layout: OPQ rotation, 256 inverted lists, 64-byte PQ codes
+INDEX_FACTORY = "OPQ64,IVF256,PQ64"
+IVF_NLIST = 256
+# IVF and PQ each train 256 centroids (~39 points each); smaller corpora use
+# an exhaustive index with FP16 scalar-quantized vectors (half of FP32).
+# "SQ8" stores int8 codes instead, and "IVF256,SQ8" adds inverted lists.
+MIN_TRAIN_POINTS_PER_LIST = 39
+SMALL_INDEX_FACTORY = "SQfp16"
+
+# Inverted lists probed per query (raise for large k or higher recall)
+DEFAULT_NPROBE = 16
+
+# GPU resources are allocated once and shared by every index moved to the GPU
+_gpu_resources = None
+
+
+def get_device() -> str:
+    """Return 'cuda' when a CUDA GPU is available, otherwise 'cpu'."""
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def index_to_gpu(index):
+    """
+    Copy a FAISS index to GPU 0 when faiss-gpu and a CUDA device are available.
+
+    Args:
+        index: CPU FAISS index
+
+    Returns:
+        GPU index, or the original index if no GPU can be used
+    """
+    global _gpu_resources
+
+    if get_device() != "cuda" or not hasattr(faiss, "StandardGpuResources"):
+        return index
+
+    try:
+        if _gpu_resources is None:
+            _gpu_resources = faiss.StandardGpuResources()
+        return faiss.index_cpu_to_gpu(_gpu_resources, 0, index)
+    except Exception as e:
+        print(f"⚠️  Could not move FAISS index to GPU, using CPU: {e}")
+        return index
+
+
+def create_embeddings() -> HuggingFaceEmbeddings:
+    """
+    Create the embeddings model.
+
+    Embeddings are L2-normalized at encode time so inner product equals
+    cosine similarity for both indexed documents and queries. The model
+    runs on the GPU when one is available.
+
+    Returns:
+        HuggingFaceEmbeddings instance
+    """
+    return HuggingFaceEmbeddings(
+        model_name=EMBEDDING_MODEL_NAME,
+        model_kwargs={"device": get_device()},
+        encode_kwargs={"normalize_embeddings": True}
+    )
+
+
+def normalize_vectors(vectors) -> np.ndarray:
+    """
+    Return vectors as a contiguous float32 matrix with unit L2 norm.
+
+    Args:
+        vectors: List of embeddings or 2D array
+
+    Returns:
+        Normalized (n, d) float32 array
+    """
+    matrix = np.ascontiguousarray(np.asarray(vectors, dtype=np.float32))
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    faiss.normalize_L2(matrix)
+    return matrix
+
+
+def choose_index_factory(num_vectors: int) -> str:
+    """
+    Pick the FAISS index_factory layout for a corpus size.
+
+    Args:
+        num_vectors: Number of vectors to index
+
+    Returns:
+        INDEX_FACTORY when there are enough vectors to train it, else SMALL_INDEX_FACTORY
+    """
+    if num_vectors >= IVF_NLIST * MIN_TRAIN_POINTS_PER_LIST:
+        return INDEX_FACTORY
+    return SMALL_INDEX_FACTORY
+
+
+def build_index(vectors: np.ndarray):
+    """
+    Build a FAISS inner-product index over normalized vectors.
+
+    Args:
+        vectors: Normalized (n, d) float32 array
+
+    Returns:
+        Trained FAISS index containing all vectors
+    """
+    n, d = vectors.shape
+    index = faiss.index_factory(d, choose_index_factory(n), faiss.METRIC_INNER_PRODUCT)
+    index.train(vectors)
+    set_nprobe(index, DEFAULT_NPROBE)
+
+    index.add(vectors)
+    return index
+
+
+def build_vector_store(
+    texts: List[str],
+    vectors: np.ndarray,
+    metadatas: List[Dict],
+    embeddings
+) -> FAISS:
+    """
+    Wrap a freshly built FAISS index in a LangChain vector store.
+
+    Args:
+        texts: Chunk texts, in the same order as vectors
+        vectors: Normalized (n, d) float32 array
+        metadatas: Metadata dict for each chunk
+        embeddings: Embeddings model used for queries
+
+    Returns:
+        FAISS vector store instance
+    """
+    index = build_index(vectors)
+
+    ids = [str(uuid.uuid4()) for _ in texts]
+    docstore = InMemoryDocstore({
+        doc_id: Document(id=doc_id, page_content=text, metadata=metadata)
+        for doc_id, text, metadata in zip(ids, texts, metadatas)
+    })
+
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=dict(enumerate(ids)),
+        distance_strategy=DISTANCE_STRATEGY
+    )
+
+
+def set_nprobe(index, nprobe: int) -> None:
+    """
+    Set how many inverted lists an IVF index probes per query.
+
+    No-op for flat indexes.
+
+    Args:
+        index: FAISS index (possibly wrapped in OPQ/PreTransform)
+        nprobe: Number of lists to probe
+    """
+    try:
+        ivf = faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return
+    ivf.nprobe = nprobe
+
+
+def configure_search_threads(index, single_query_mode: bool) -> None:
+    """
+    Pick the FAISS threading strategy for how the index will be queried.
+
+    FAISS parallelizes across the queries in a batch. A server that handles
+    concurrent requests should use one OpenMP thread per search, so threads
+    are not started for every call. Sequential single-query callers such as
+    the test suite should use all cores and let IVF indexes split each query
+    across inverted lists (parallel_mode=1).
+
+    The OpenMP thread count applies to the whole process.
+
+    Args:
+        index: FAISS index
+        single_query_mode: True for one-at-a-time searches, False for serving
+    """
+    faiss.omp_set_num_threads((os.cpu_count() or 1) if single_query_mode else 1)
+
+    if single_query_mode:
+        try:
+            faiss.extract_index_ivf(index).parallel_mode = 1
+        except RuntimeError:
+            pass
+
+
+def load_vector_store(
+    folder_path: Union[str, Path],
+    embeddings=None,
+    use_cache: bool = True,
+    nprobe: int = DEFAULT_NPROBE,
+    single_query_mode: bool = False
+) -> FAISS:
+    """
+    Load a persisted FAISS vector store with the shared distance strategy.
+    The index is searched on the GPU when one is available.
+
+    Raises ValueError when the saved index was built with a different metric
+    than DISTANCE_STRATEGY (rebuild it with create_vectordb.py), since scores
+    would otherwise be read in the wrong direction.
+
+    Args:
+        folder_path: Directory containing index.faiss and index.pkl
+        embeddings: Optional embeddings model (created if not provided)
+        use_cache: Cache repeated similarity searches (see query_cache.py)
+        nprobe: Inverted lists probed per query (IVF indexes only)
+        single_query_mode: Use all cores per query instead of one thread
+            per concurrent request (see configure_search_threads)
+
+    Returns:
+        FAISS vector store instance
+    """
+    if embeddings is None:
+        embeddings = create_embeddings()
+
+    vector_store = FAISS.load_local(
+        str(folder_path),
+        embeddings,
+        allow_dangerous_deserialization=True,
+        distance_strategy=DISTANCE_STRATEGY
+    )
+    expected_metric = FAISS_METRICS[DISTANCE_STRATEGY]
+    if vector_store.index.metric_type != expected_metric:
+        raise ValueError(
+            f"FAISS index in {folder_path} uses metric {vector_store.index.metric_type}, "
+            f"but {DISTANCE_STRATEGY.value} needs metric {expected_metric}; "
+            "rebuild it with create_vectordb.py"
+        )
+    set_nprobe(vector_store.index, nprobe)
+    configure_search_threads(vector_store.index, single_query_mode)
+    vector_store.index = index_to_gpu(vector_store.index)
+
+    if use_cache:
+        enable_query_cache(vector_store)
+
+    return vector_store
@@ -0,0 +1,180 @@
+"""
+Thread-safe LRU + TTL cache for vector store queries.
+Repeated queries skip the embedding call and the FAISS search.
+"""
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import faiss
+
+
+# Default cache settings
+DEFAULT_MAX_SIZE = 512
+DEFAULT_TTL_SECONDS = 600
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query string for use in a cache key.
+
+    Args:
+        query: Raw query text
+
+    Returns:
+        Lowercased query with collapsed whitespace
+    """
+    return _WHITESPACE_RE.sub(' ', query.strip().lower())
+
+
+def current_nprobe(index) -> Optional[int]:
+    """
+    Return how many inverted lists an IVF index currently probes per query.
+
+    Args:
+        index: FAISS index (possibly wrapped in OPQ/PreTransform)
+
+    Returns:
+        The IVF nprobe, or None for indexes without inverted lists
+    """
+    try:
+        return faiss.extract_index_ivf(index).nprobe
+    except RuntimeError:
+        return None
+
+
+class QueryCache:
+    """LRU cache with per-entry TTL expiry, safe to share across threads."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached entries (e.g. after the index is rebuilt)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and current size
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / total if total else 0.0,
+                "size": len(self._entries),
+            }
+
+
+def cached(
+    search_fn: Callable,
+    cache: QueryCache,
+    name: str,
+    search_depth: Optional[Callable[[], Hashable]] = None
+) -> Callable:
+    """
+    Wrap a vector store search method with the query cache.
+
+    Calls with extra keyword arguments (e.g. metadata filters) bypass the cache.
+
+    Args:
+        search_fn: Bound search method taking (query, k)
+        cache: Cache to read from and write to
+        name: Method name, kept in the key so methods don't share entries
+        search_depth: Returns the index's current search settings (e.g. nprobe),
+            kept in the key so results from another depth are never served
+
+    Returns:
+        Cached search function with the same signature
+    """
+    @wraps(search_fn)
+    def wrapper(query: str, k: int = 4, **kwargs):
+        if kwargs:
+            return search_fn(query, k=k, **kwargs)
+
+        key = (name, normalize_query(query), k, search_depth() if search_depth else None)
+        results = cache.get(key)
+        if results is None:
+            results = search_fn(query, k=k)
+            cache.put(key, results)
+
+        # Callers get their own list so they can't mutate the cached one
+        return list(results)
+
+    return wrapper
+
+
+def enable_query_cache(vector_store, cache: Optional[QueryCache] = None) -> QueryCache:
+    """
+    Put a query cache in front of a vector store's similarity search methods.
+
+    Args:
+        vector_store: FAISS vector store instance
+        cache: Optional cache to use (a new one is created if not provided)
+
+    Returns:
+        The QueryCache attached to the vector store
+    """
+    if cache is None:
+        cache = QueryCache()
+
+    def search_depth():
+        return current_nprobe(vector_store.index)
+
+    for name in ("similarity_search", "similarity_search_with_score"):
+        setattr(vector_store, name, cached(getattr(vector_store, name), cache, name, search_depth))
+
+    vector_store.query_cache = cache
+    return cache
@@ -4,13 +4,22 @@ Tests loading, querying, metadata integrity, and retrieval quality
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain_community.vectorstores import FAISS
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from vectordb.faiss_store import (
+    DEFAULT_NPROBE,
+    EMBEDDING_MODEL_NAME,
+    create_embeddings,
+    load_vector_store,
+    set_nprobe,
+)
 import json
 
 
@@ -18,6 +27,27 @@ import json
 SCRIPT_DIR = Path(__file__).parent
 VECTOR_DB_DIR = SCRIPT_DIR / "faiss_index"
 
+# Precomputed embeddings of the fixed test queries
+QUERY_EMBEDDINGS_FILE = VECTOR_DB_DIR / "test_query_embeddings.npy"
+QUERY_LIST_FILE = VECTOR_DB_DIR / "test_query_embeddings.json"
+
+# Every hard-coded query issued by this suite
+TEST_QUERIES = [
+    "test", "refrigerator", "dishwasher", "repair", "policy",
+    "ice maker not working", "dishwasher not draining water", "leaking refrigerator",
+    "door won't close", "return policy",
+    "ice maker repair", "dishwasher warranty", "refrigerator door seal",
+    "dishwasher repair tips", "replace ice maker",
+    "repair guide",
+    "my refrigerator ice maker stopped making ice", "dishwasher not cleaning dishes properly",
+    "what is your return and refund policy", "how to replace door latch",
+    "", "refrigerator " * 100, "!@#$%^&*() refrigerator repair", "réfrigérateur problème",
+]
+
+# IVF lists probed per query; large-k searches probe more to fill k results
+NPROBE = DEFAULT_NPROBE
+LARGE_K_NPROBE = 256
+
 
 def print_separator(char="=", length=80):
     """Print a separator line."""
@@ -31,8 +61,63 @@ def print_subsection(title):
     print('─' * 80)
 
 
+class CachedQueryEmbeddings(Embeddings):
+    """Serve known query embeddings from a precomputed matrix, encode the rest."""
+
+    def __init__(self, base: Embeddings, queries, vectors):
+        self.base = base
+        self.rows = {query: i for i, query in enumerate(queries)}
+        self.vectors = vectors
+
+    def embed_documents(self, texts):
+        return self.base.embed_documents(texts)
+
+    def embed_query(self, text):
+        row = self.rows.get(text)
+        if row is None:
+            return self.base.embed_query(text)
+        return self.vectors[row].tolist()
+
+
+def load_query_embeddings(embeddings) -> CachedQueryEmbeddings:
+    """
+    Load cached embeddings for TEST_QUERIES, computing and saving them on first run.
+
+    The cache is rebuilt whenever the query list or embedding model changes.
+
+    Args:
+        embeddings: Embeddings model used for the index
+
+    Returns:
+        Embeddings wrapper that skips encoding for the fixed test queries
+    """
+    cache_key = {"model": EMBEDDING_MODEL_NAME, "queries": TEST_QUERIES}
+
+    if QUERY_EMBEDDINGS_FILE.exists() and QUERY_LIST_FILE.exists():
+        with open(QUERY_LIST_FILE, 'r', encoding='utf-8') as f:
+            if json.load(f) == cache_key:
+                vectors = np.load(QUERY_EMBEDDINGS_FILE, mmap_mode='r')
+                print(f"Using cached embeddings for {len(TEST_QUERIES)} test queries")
+                return CachedQueryEmbeddings(embeddings, TEST_QUERIES, vectors)
+
+    print(f"Encoding {len(TEST_QUERIES)} test queries (cached for next run)...")
+    vectors = np.asarray(embeddings.embed_documents(TEST_QUERIES), dtype=np.float32)
+    np.save(QUERY_EMBEDDINGS_FILE, vectors)
+    with open(QUERY_LIST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache_key, f, ensure_ascii=False)
+
+    return CachedQueryEmbeddings(embeddings, TEST_QUERIES, vectors)
+
+
 def load_vector_database():
-    """Load the FAISS vector database."""
+    """
+    Load the FAISS vector database.
+
+    The tests run one query at a time, so the store is loaded in single-query
+    mode: FAISS uses every core for each search. The vector search tool uses
+    the default of one thread per search because it serves concurrent
+    requests.
+    """
     print_separator()
     print("LOADING VECTOR DATABASE")
     print_separator()
@@ -46,17 +131,13 @@ def load_vector_database():
     print(f"📂 Loading from: {VECTOR_DB_DIR}")
 
     # Initialize embeddings (must match the model used during creation)
-    print("Loading embeddings model: sentence-transformers/all-MiniLM-L6-v2")
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
-    )
+    print(f"Loading embeddings model: {EMBEDDING_MODEL_NAME}")
+    embeddings = load_query_embeddings(create_embeddings())
 
     # Load vector store
     print("Loading FAISS index...")
-    vector_store = FAISS.load_local(
-        str(VECTOR_DB_DIR),
-        embeddings,
-        allow_dangerous_deserialization=True
+    vector_store = load_vector_store(
+        VECTOR_DB_DIR, embeddings, nprobe=NPROBE, single_query_mode=True
     )
 
     print("✅ Vector database loaded successfully!")
@@ -81,34 +162,34 @@ def test_database_stats(vector_store):
     print(f"Successfully retrieved sample documents: {len(sample_docs)}")
     print()
 
-    # Analyze document types
-    doc_types = {}
-    appliance_types = {}
-
-    # Get more samples to analyze
+    # Get more samples to analyze (all queries in one FAISS search)
     test_queries = ["refrigerator", "dishwasher", "repair", "policy"]
-    all_samples = []
-
-    for query in test_queries:
-        docs = vector_store.similarity_search(query, k=25)
-        all_samples.extend(docs)
+    query_vectors = np.asarray(
+        [vector_store.embedding_function.embed_query(q) for q in test_queries],
+        dtype=np.float32
+    )
+    _, indices = vector_store.index.search(query_vectors, 25)
+    all_samples = [
+        vector_store.docstore.search(vector_store.index_to_docstore_id[i])
+        for i in indices.ravel()
+        if i != -1
+    ]
 
     # Count document types
-    for doc in all_samples:
-        doc_type = doc.metadata.get('document_type', 'unknown')
-        doc_types[doc_type] = doc_types.get(doc_type, 0) + 1
-
-        appliance = doc.metadata.get('appliance_type', 'unknown')
-        if appliance and appliance != 'unknown':
-            appliance_types[appliance] = appliance_types.get(appliance, 0) + 1
+    doc_types = Counter(doc.metadata.get('document_type', 'unknown') for doc in all_samples)
+    appliance_types = Counter(
+        doc.metadata.get('appliance_type')
+        for doc in all_samples
+        if doc.metadata.get('appliance_type') not in (None, '', 'unknown')
+    )
 
     print("Document type distribution (from sample):")
-    for doc_type, count in sorted(doc_types.items()):
+    for doc_type, count in doc_types.most_common():
         print(f"  {doc_type}: {count} documents")
     print()
 
     print("Appliance type distribution (from sample):")
-    for appliance, count in sorted(appliance_types.items()):
+    for appliance, count in appliance_types.most_common():
         print(f"  {appliance}: {count} documents")
     print()
 
@@ -470,10 +551,13 @@ def test_edge_cases(vector_store):
     print("Test 5: Very large k value")
     print("-" * 80)
     try:
+        set_nprobe(vector_store.index, LARGE_K_NPROBE)
         results = vector_store.similarity_search("refrigerator", k=1000)
         print(f"✅ Handled large k value, returned {len(results)} results")
     except Exception as e:
         print(f"❌ Failed with error: {str(e)}")
+    finally:
+        set_nprobe(vector_store.index, NPROBE)
     print()
 
 
@@ -533,6 +617,12 @@ def run_all_tests():
     test_edge_cases(vector_store)
     test_as_retriever(vector_store)
 
+    # Query cache
+    stats = vector_store.query_cache.stats()
+    print(f"Query cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hit_rate']:.1%} hit rate)")
+    print()
+
     # Summary
     print_separator()
     print("TEST SUITE COMPLETE")
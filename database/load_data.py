@@ -2,17 +2,20 @@
 ETL Script: Load enriched CSV data into PostgreSQL database
 """
 
+import csv
+import io
 import os
-import json
 import sys
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import orjson
 import pandas as pd
 import psycopg2
-from psycopg2.extras import execute_batch
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -30,6 +33,42 @@ DB_CONFIG = {
 # File paths
 CSV_PATH = Path(__file__).parent.parent / 'scraping' / 'data' / 'processed' / 'parts_latest.csv'
 
+# Tables written by the ETL (secondary indexes are rebuilt after the load)
+LOAD_TABLES = ['parts', 'models', 'part_model_mapping']
+
+# Columns written to the parts table, in COPY order
+PART_COLUMNS = [
+    'part_name', 'manufacturer_part_number', 'part_number', 'brand', 'appliance_type',
+    'current_price', 'original_price',
+    'rating', 'review_count',
+    'description', 'symptoms', 'replacement_parts',
+    'installation_difficulty', 'installation_time',
+    'delivery_time', 'availability',
+    'image_url', 'video_url', 'product_url',
+    'compatible_models_count'
+]
+
+# NULL marker for COPY (keeps empty strings distinct from NULL)
+NULL_MARKER = '\\N'
+
+# Explicit column types so the CSV is parsed once, without inference
+TEXT_COLUMNS = [
+    'part_name', 'manufacturer_part_number', 'part_number', 'brand', 'appliance_type',
+    'description', 'symptoms', 'replacement_parts',
+    'installation_difficulty', 'installation_time',
+    'delivery_time', 'availability',
+    'image_url', 'video_url', 'product_url',
+    'compatible_models_json'
+]
+CSV_DTYPES = {
+    **{col: 'string' for col in TEXT_COLUMNS},
+    'current_price': 'float32',
+    'original_price': 'float32',
+    'rating': 'float32',
+    'review_count': 'int32',
+    'compatible_models_count': 'int32',
+}
+
 
 def get_db_connection():
     """Create and return database connection."""
@@ -47,6 +86,57 @@ def get_db_connection():
         sys.exit(1)
 
 
+@contextmanager
+def bulk_load(conn):
+    """
+    Run a bulk load as one transaction.
+
+    Secondary indexes are dropped before the load and rebuilt in one pass
+    afterwards, then the tables are analyzed. DDL is transactional in
+    PostgreSQL, so the drop, the load and the rebuild commit together: if
+    the load fails or is interrupted, the rollback restores the indexes
+    along with the old rows. Readers of these tables wait until the load
+    commits. Primary keys and unique constraints stay in place because the
+    upserts rely on them. Commits are asynchronous for the session: a crash
+    can lose the last few commits, and the ETL is simply re-run in that case.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SET synchronous_commit = off;")
+
+    # Indexes that don't back a primary key or constraint
+    cursor.execute("""
+        SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = ANY(%s::regclass[])
+          AND NOT i.indisprimary
+          AND NOT EXISTS (
+              SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid
+          );
+    """, (LOAD_TABLES,))
+    index_defs = cursor.fetchall()
+
+    try:
+        print(f"\n🗂️  Dropping {len(index_defs)} secondary indexes for bulk load...")
+        for index_name, _ in index_defs:
+            cursor.execute(f"DROP INDEX {index_name};")
+
+        yield
+
+        print("\n🗂️  Recreating secondary indexes...")
+        for _, index_def in index_defs:
+            cursor.execute(index_def)
+        cursor.execute(f"ANALYZE {', '.join(LOAD_TABLES)};")
+        conn.commit()
+    except BaseException:
+        # Also on Ctrl-C: the dropped indexes come back with the rollback
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+    print(f"✅ Recreated {len(index_defs)} indexes and analyzed tables")
+
+
 def load_csv_data():
     """Load and prepare CSV data."""
     print(f"\n📂 Loading CSV from: {CSV_PATH}")
@@ -55,99 +145,68 @@ def load_csv_data():
         print(f"❌ CSV file not found: {CSV_PATH}")
         sys.exit(1)
 
-    df = pd.read_csv(CSV_PATH)
+    df = pd.read_csv(CSV_PATH, engine='pyarrow', dtype_backend='pyarrow', dtype=CSV_DTYPES)
     print(f"✅ Loaded {len(df)} parts from CSV")
     return df
 
 
+def _parse_models_json(value):
+    """
+    Parse a compatible_models_json cell.
+
+    Returns:
+        List of model dicts ([] for empty cells), or None if the JSON is invalid
+    """
+    if pd.isna(value) or not value.strip():
+        return []
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return None
+
+
 def insert_parts(conn, df):
-    """Insert parts data into database."""
+    """Insert parts data into database (bulk_load commits it)."""
     print("\n📦 Inserting parts into database...")
 
     cursor = conn.cursor()
 
-    # Prepare insert query
-    insert_query = """
-    INSERT INTO parts (
-        part_name, manufacturer_part_number, part_number, brand, appliance_type,
-        current_price, original_price,
-        rating, review_count,
-        description, symptoms, replacement_parts,
-        installation_difficulty, installation_time,
-        delivery_time, availability,
-        image_url, video_url, product_url,
-        compatible_models_count
-    ) VALUES (
-        %s, %s, %s, %s, %s,
-        %s, %s,
-        %s, %s,
-        %s, %s, %s,
-        %s, %s,
-        %s, %s,
-        %s, %s, %s,
-        %s
+    # Duplicate part numbers would violate the unique constraint and abort the COPY
+    duplicates = df['manufacturer_part_number'].duplicated()
+    for part_name in df.loc[duplicates, 'part_name']:
+        print(f"  ⚠️  Skipping duplicate part {part_name}")
+    df = df.loc[~duplicates].copy()
+
+    # Parse all compatible models JSON up front and report bad rows in one pass
+    df['_models'] = df['compatible_models_json'].map(_parse_models_json)
+    invalid = df['_models'].isna()
+    for part_name in df.loc[invalid, 'part_name']:
+        print(f"  ⚠️  Invalid JSON for part {part_name}")
+
+    # Assign ids client-side so the whole table goes in with one COPY
+    df['part_id'] = [str(uuid.uuid4()) for _ in range(len(df))]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in df[['part_id'] + PART_COLUMNS].itertuples(index=False, name=None):
+        writer.writerow([NULL_MARKER if pd.isna(value) else value for value in row])
+    buffer.seek(0)
+
+    cursor.copy_expert(
+        f"COPY parts (part_id, {', '.join(PART_COLUMNS)}) "
+        f"FROM STDIN WITH (FORMAT csv, NULL '{NULL_MARKER}')",
+        buffer
     )
-    RETURNING part_id;
-    """
 
-    part_ids = []
-    compatible_models_data = []  # Store for later processing
-
-    for idx, row in df.iterrows():
-        # Prepare values
-        values = (
-            row.get('part_name', ''),
-            row.get('manufacturer_part_number', ''),
-            row.get('part_number', ''),
-            row.get('brand', ''),
-            row.get('appliance_type', ''),
-
-            float(row.get('current_price', 0)),
-            float(row.get('original_price', 0)),
-
-            float(row.get('rating', 0)) if pd.notna(row.get('rating')) else None,
-            int(row.get('review_count', 0)),
-
-            row.get('description', ''),
-            row.get('symptoms', ''),
-            row.get('replacement_parts', ''),
-
-            row.get('installation_difficulty', ''),
-            row.get('installation_time', ''),
-
-            row.get('delivery_time', ''),
-            row.get('availability', ''),
-
-            row.get('image_url', ''),
-            row.get('video_url', ''),
-            row.get('product_url', ''),
-
-            int(row.get('compatible_models_count', 0))
-        )
-
-        try:
-            cursor.execute(insert_query, values)
-            part_id = cursor.fetchone()[0]
-            part_ids.append(part_id)
-
-            # Store compatible models JSON for this part
-            models_json = row.get('compatible_models_json', '')
-            if models_json and models_json.strip():
-                try:
-                    models = json.loads(models_json)
-                    compatible_models_data.append({
-                        'part_id': part_id,
-                        'models': models
-                    })
-                except json.JSONDecodeError:
-                    print(f"  ⚠️  Invalid JSON for part {row.get('part_name')}")
-
-        except Exception as e:
-            print(f"  ❌ Error inserting part {row.get('part_name')}: {e}")
-            conn.rollback()
-            continue
-
-    conn.commit()
+    part_ids = df['part_id'].tolist()
+
+    # Store compatible models for later processing
+    compatible_models_data = [
+        {'part_id': part_id, 'models': models}
+        for part_id, models in zip(df['part_id'], df['_models'])
+        if models
+    ]
+
     print(f"✅ Inserted {len(part_ids)} parts")
 
     cursor.close()
@@ -155,71 +214,62 @@ def insert_parts(conn, df):
 
 
 def insert_models_and_mappings(conn, compatible_models_data):
-    """Insert models and create part-model mappings."""
+    """Insert models and create part-model mappings (bulk_load commits them)."""
     print("\n🏷️  Inserting models and creating mappings...")
 
     cursor = conn.cursor()
 
-    # Track unique models
-    model_cache = {}  # model_number -> model_id
-    total_models = 0
-    total_mappings = 0
-
     # First pass: Insert all unique models
     print("  Step 1: Extracting unique models...")
-    unique_models = set()
+    # Keyed by model number: a single upsert statement cannot touch the same row twice
+    unique_models = {}
     for item in compatible_models_data:
         for model in item['models']:
             model_number = model.get('model_number', '').strip()
             if model_number:
-                unique_models.add((model_number, model.get('model_url', '')))
+                unique_models[model_number] = model.get('model_url', '')
 
     print(f"  Found {len(unique_models)} unique models")
 
-    # Insert models
+    # Insert all models in one statement (two arrays, one round-trip) and read back their ids
     print("  Step 2: Inserting models...")
     insert_model_query = """
     INSERT INTO models (model_number, model_url)
-    VALUES (%s, %s)
+    SELECT * FROM unnest(%s::text[], %s::text[])
     ON CONFLICT (model_number) DO UPDATE SET model_url = EXCLUDED.model_url
     RETURNING model_id, model_number;
     """
 
-    for model_number, model_url in unique_models:
-        try:
-            cursor.execute(insert_model_query, (model_number, model_url))
-            model_id, model_num = cursor.fetchone()
-            model_cache[model_num] = model_id
-            total_models += 1
-        except Exception as e:
-            print(f"    ⚠️  Error inserting model {model_number}: {e}")
-            continue
-
-    conn.commit()
+    cursor.execute(insert_model_query, (list(unique_models.keys()), list(unique_models.values())))
+    rows = cursor.fetchall()
+    model_cache = {model_num: model_id for model_id, model_num in rows}
+    total_models = len(model_cache)
+
     print(f"  ✅ Inserted {total_models} models")
 
     # Second pass: Create part-model mappings
     print("  Step 3: Creating part-model mappings...")
-    insert_mapping_query = """
+    mapping_values = [
+        (item['part_id'], model_cache[model_number])
+        for item in compatible_models_data
+        for model_number in (m.get('model_number', '').strip() for m in item['models'])
+        if model_number in model_cache
+    ]
+
+    # COPY the pairs into a staging table, then insert them in one statement
+    cursor.execute("""
+    CREATE TEMP TABLE _pmm (part_id UUID, model_id UUID) ON COMMIT DROP;
+    """)
+    buffer = io.StringIO(''.join(f"{part_id}\t{model_id}\n" for part_id, model_id in mapping_values))
+    cursor.copy_expert("COPY _pmm (part_id, model_id) FROM STDIN", buffer)
+
+    cursor.execute("""
     INSERT INTO part_model_mapping (part_id, model_id)
-    VALUES (%s, %s)
+    SELECT DISTINCT part_id, model_id FROM _pmm
     ON CONFLICT (part_id, model_id) DO NOTHING;
-    """
-
-    mapping_values = []
-    for item in compatible_models_data:
-        part_id = item['part_id']
-        for model in item['models']:
-            model_number = model.get('model_number', '').strip()
-            if model_number and model_number in model_cache:
-                model_id = model_cache[model_number]
-                mapping_values.append((part_id, model_id))
-
-    # Batch insert mappings
-    execute_batch(cursor, insert_mapping_query, mapping_values, page_size=1000)
-    total_mappings = len(mapping_values)
+    """)
+    total_mappings = cursor.rowcount
 
-    conn.commit()
     print(f"  ✅ Created {total_mappings} part-model mappings")
 
     cursor.close()
@@ -303,11 +353,12 @@ def main():
     conn = get_db_connection()
 
     try:
-        # Step 3: Insert parts
-        part_ids, compatible_models_data = insert_parts(conn, df)
+        with bulk_load(conn):
+            # Step 3: Insert parts
+            part_ids, compatible_models_data = insert_parts(conn, df)
 
-        # Step 4: Insert models and mappings
-        total_models, total_mappings = insert_models_and_mappings(conn, compatible_models_data)
+            # Step 4: Insert models and mappings
+            total_models, total_mappings = insert_models_and_mappings(conn, compatible_models_data)
 
         # Step 5: Verify
         verify_data(conn)
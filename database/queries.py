@@ -3,11 +3,19 @@ Common database queries for PartSelect Chatbot
 Use these functions in your chatbot to retrieve data
 """
 
+import atexit
 import os
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import re
+import threading
+from contextlib import contextmanager
+
+from cachetools import TTLCache, cached
+from cachetools.keys import hashkey
+from psycopg.rows import dict_row
+from psycopg.types.uuid import UUIDBinaryLoader, UUIDLoader
+from psycopg_pool import ConnectionPool
 from dotenv import load_dotenv
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional, Union
 
 # Load environment variables
 load_dotenv()
@@ -16,15 +24,91 @@ load_dotenv()
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'localhost'),
     'port': os.getenv('DB_PORT', '5432'),
-    'database': os.getenv('DB_NAME', 'partselect_db'),
+    'dbname': os.getenv('DB_NAME', 'partselect_db'),
     'user': os.getenv('DB_USER', 'postgres'),
     'password': os.getenv('DB_PASSWORD', '')
 }
 
+# Search terms that look like part numbers (prefix-matched): letters, digits
+# and dashes with at least one digit, so plain words still match anywhere
+SKU_PATTERN = re.compile(r'(?=[A-Za-z-]*[0-9])[A-Za-z0-9-]{3,}')
 
+# Result caches for slow-changing queries. They live in each process that
+# imports this module, so a reload by load_data.py (a separate process) can't
+# clear them: cached results go stale for at most RESULT_CACHE_TTL after it
+RESULT_CACHE_TTL = 60  # seconds
+_stats_cache = TTLCache(maxsize=1, ttl=RESULT_CACHE_TTL)
+_top_rated_cache = TTLCache(maxsize=256, ttl=RESULT_CACHE_TTL)
+_cache_lock = threading.RLock()
+
+# Shared connection pool, created on first use
+_pool = None
+_pool_lock = threading.Lock()
+
+
+class UUIDStrLoader(UUIDLoader):
+    """Load uuid columns as strings, like psycopg2 did."""
+
+    def load(self, data):
+        return str(super().load(data))
+
+
+class UUIDStrBinaryLoader(UUIDBinaryLoader):
+    """Binary-protocol counterpart of UUIDStrLoader."""
+
+    def load(self, data):
+        return str(super().load(data))
+
+
+def configure_connection(conn) -> None:
+    """Register per-connection type loaders when the pool opens a connection."""
+    conn.adapters.register_loader("uuid", UUIDStrLoader)
+    conn.adapters.register_loader("uuid", UUIDStrBinaryLoader)
+
+
+def get_pool() -> ConnectionPool:
+    """Create the shared connection pool on first use and return it."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(
+                    min_size=2,
+                    max_size=25,
+                    kwargs={**DB_CONFIG, 'row_factory': dict_row},
+                    configure=configure_connection,
+                    open=True
+                )
+                atexit.register(_pool.close)
+    return _pool
+
+
+@contextmanager
 def get_db_connection():
-    """Create and return database connection with dict cursor."""
-    return psycopg2.connect(**DB_CONFIG, cursor_factory=RealDictCursor)
+    """
+    Borrow a pooled database connection that returns rows as dicts.
+
+    The transaction is committed when the block succeeds and rolled back
+    on error; the connection then goes back to the pool.
+
+    Open cursors with binary=True so results use the binary wire format,
+    and execute with prepare=True so the statement is parsed and planned
+    once per connection.
+
+    Example:
+        >>> with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        >>>     cursor.execute("SELECT 1", prepare=True)
+    """
+    with get_pool().connection() as conn:
+        yield conn
+
+
+def invalidate_result_cache():
+    """Clear this process's cached query results instead of waiting out RESULT_CACHE_TTL."""
+    with _cache_lock:
+        _stats_cache.clear()
+        _top_rated_cache.clear()
 
 
 # ==========================================
@@ -34,6 +118,8 @@ def find_parts_by_model(model_number: str) -> List[Dict]:
     """
     Find all parts compatible with a specific appliance model.
 
+    Matches the exact model number, ignoring case.
+
     Args:
         model_number: The appliance model number (e.g., 'WDT780SAEM1')
 
@@ -44,41 +130,36 @@ def find_parts_by_model(model_number: str) -> List[Dict]:
         >>> parts = find_parts_by_model('WDT780SAEM1')
         >>> print(f"Found {len(parts)} compatible parts")
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
-        p.part_id,
-        p.part_name,
-        p.manufacturer_part_number,
-        p.brand,
-        p.current_price,
-        p.original_price,
-        p.has_discount,
-        p.discount_percentage,
-        p.rating,
-        p.review_count,
-        p.description,
-        p.symptoms,
-        p.installation_difficulty,
-        p.installation_time,
-        p.video_url,
-        p.product_url
-    FROM parts p
-    JOIN part_model_mapping pmm ON p.part_id = pmm.part_id
-    JOIN models m ON pmm.model_id = m.model_id
-    WHERE m.model_number ILIKE %s
-    ORDER BY p.rating DESC NULLS LAST, p.review_count DESC;
-    """
-
-    cursor.execute(query, (model_number,))
-    results = cursor.fetchall()
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        query = """
+        SELECT
+            p.part_id,
+            p.part_name,
+            p.manufacturer_part_number,
+            p.brand,
+            p.current_price,
+            p.original_price,
+            p.has_discount,
+            p.discount_percentage,
+            p.rating,
+            p.review_count,
+            p.description,
+            p.symptoms,
+            p.installation_difficulty,
+            p.installation_time,
+            p.video_url,
+            p.product_url
+        FROM parts p
+        JOIN part_model_mapping pmm ON p.part_id = pmm.part_id
+        JOIN models m ON pmm.model_id = m.model_id
+        WHERE upper(m.model_number) = upper(%s)
+        ORDER BY p.rating DESC NULLS LAST, p.review_count DESC
+        """
 
-    cursor.close()
-    conn.close()
+        cursor.execute(query, (model_number,), prepare=True)
+        results = cursor.fetchall()
 
-    return [dict(row) for row in results]
+    return results
 
 
 # ==========================================
@@ -100,11 +181,7 @@ def find_parts_by_symptom(symptom: str, limit: int = 10) -> List[Dict]:
         >>> for part in parts:
         >>>     print(f"{part['part_name']}: ${part['current_price']}")
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
+    columns = """
         part_id,
         part_name,
         manufacturer_part_number,
@@ -118,26 +195,39 @@ def find_parts_by_symptom(symptom: str, limit: int = 10) -> List[Dict]:
         installation_time,
         video_url,
         product_url
+    """
+
+    # Full-text search on the indexed search_tsv column
+    fts_query = f"""
+    SELECT {columns}
     FROM parts
-    WHERE to_tsvector('english', symptoms || ' ' || description)
-          @@ to_tsquery('english', %s)
-       OR symptoms ILIKE %s
-       OR description ILIKE %s
+    WHERE search_tsv @@ websearch_to_tsquery('english', %s)
     ORDER BY rating DESC NULLS LAST, review_count DESC
     LIMIT %s;
     """
 
-    # Prepare search terms
-    search_query = ' & '.join(symptom.split())  # Full-text search
+    # Substring fallback (sequential scan), only used when full-text finds nothing
+    like_query = f"""
+    SELECT {columns}
+    FROM parts
+    WHERE symptoms ILIKE %(pattern)s
+       OR description ILIKE %(pattern)s
+    ORDER BY rating DESC NULLS LAST, review_count DESC
+    LIMIT %(limit)s;
+    """
+
+    # The server tokenizes the raw text, so operator characters can't break the query
     like_pattern = f'%{symptom}%'  # LIKE search
 
-    cursor.execute(query, (search_query, like_pattern, like_pattern, limit))
-    results = cursor.fetchall()
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        cursor.execute(fts_query, (symptom, limit), prepare=True)
+        results = cursor.fetchall()
 
-    cursor.close()
-    conn.close()
+        if not results:
+            cursor.execute(like_query, {'pattern': like_pattern, 'limit': limit}, prepare=True)
+            results = cursor.fetchall()
 
-    return [dict(row) for row in results]
+    return results
 
 
 # ==========================================
@@ -147,6 +237,10 @@ def find_parts_by_name_or_number(search_term: str, limit: int = 10) -> List[Dict
     """
     Search for parts by name or part number.
 
+    Names match anywhere in the text. Part numbers match by prefix when the
+    search term looks like a SKU (letters, digits and dashes, 3+ chars, at
+    least one digit), and anywhere in the text otherwise.
+
     Args:
         search_term: Part name or number to search for
         limit: Maximum number of results
@@ -158,42 +252,53 @@ def find_parts_by_name_or_number(search_term: str, limit: int = 10) -> List[Dict
         >>> parts = find_parts_by_name_or_number('door shelf')
         >>> print(parts[0]['part_name'])
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
-        part_id,
-        part_name,
-        manufacturer_part_number,
-        part_number,
-        brand,
-        current_price,
-        original_price,
-        has_discount,
-        rating,
-        review_count,
-        description,
-        product_url
-    FROM parts
-    WHERE part_name ILIKE %s
-       OR manufacturer_part_number ILIKE %s
-       OR part_number ILIKE %s
-       OR to_tsvector('english', part_name) @@ to_tsquery('english', %s)
-    ORDER BY rating DESC NULLS LAST
-    LIMIT %s;
-    """
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        query = """
+        SELECT
+            part_id,
+            part_name,
+            manufacturer_part_number,
+            part_number,
+            brand,
+            current_price,
+            original_price,
+            has_discount,
+            rating,
+            review_count,
+            description,
+            product_url
+        FROM parts
+        WHERE part_name ILIKE %(name_pattern)s
+           OR upper(manufacturer_part_number) LIKE %(number_pattern)s
+           OR upper(part_number) LIKE %(number_pattern)s
+           OR to_tsvector('english', part_name) @@ websearch_to_tsquery('english', %(search_term)s)
+        ORDER BY rating DESC NULLS LAST
+        LIMIT %(limit)s;
+        """
 
-    like_pattern = f'%{search_term}%'
-    search_query = ' & '.join(search_term.split())
+        like_pattern = f'%{search_term}%'
 
-    cursor.execute(query, (like_pattern, like_pattern, like_pattern, search_query, limit))
-    results = cursor.fetchall()
+        # SKU-like terms match part numbers by prefix, which can use the
+        # upper(...) text_pattern_ops indexes instead of a full scan; other
+        # terms match anywhere via the upper(...) trigram indexes
+        if SKU_PATTERN.fullmatch(search_term):
+            number_pattern = f'{search_term.upper()}%'
+        else:
+            number_pattern = like_pattern.upper()
 
-    cursor.close()
-    conn.close()
+        cursor.execute(
+            query,
+            {
+                'name_pattern': like_pattern,
+                'number_pattern': number_pattern,
+                'search_term': search_term,
+                'limit': limit
+            },
+            prepare=True
+        )
+        results = cursor.fetchall()
 
-    return [dict(row) for row in results]
+    return results
 
 
 # ==========================================
@@ -215,47 +320,51 @@ def get_discounted_parts(min_discount: float = 0, limit: int = 20) -> List[Dict]
         >>> for deal in deals:
         >>>     print(f"{deal['part_name']}: {deal['discount_percentage']}% OFF")
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
-        part_id,
-        part_name,
-        manufacturer_part_number,
-        brand,
-        original_price,
-        current_price,
-        discount_percentage,
-        rating,
-        review_count,
-        product_url
-    FROM parts
-    WHERE has_discount = TRUE
-      AND discount_percentage >= %s
-    ORDER BY discount_percentage DESC, rating DESC NULLS LAST
-    LIMIT %s;
-    """
-
-    cursor.execute(query, (min_discount, limit))
-    results = cursor.fetchall()
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        query = """
+        SELECT
+            part_id,
+            part_name,
+            manufacturer_part_number,
+            brand,
+            original_price,
+            current_price,
+            discount_percentage,
+            rating,
+            review_count,
+            product_url
+        FROM parts
+        WHERE has_discount = TRUE
+          AND discount_percentage >= %s
+        ORDER BY discount_percentage DESC, rating DESC NULLS LAST
+        LIMIT %s;
+        """
 
-    cursor.close()
-    conn.close()
+        cursor.execute(query, (min_discount, limit), prepare=True)
+        results = cursor.fetchall()
 
-    return [dict(row) for row in results]
+    return results
 
 
 # ==========================================
 # QUERY 5: Get Top-Rated Parts
 # ==========================================
-def get_top_rated_parts(min_reviews: int = 5, limit: int = 20) -> List[Dict]:
+def get_top_rated_parts(
+    min_reviews: int = 5,
+    limit: int = 20,
+    max_price: Optional[float] = None
+) -> List[Dict]:
     """
     Find highest-rated parts with minimum review count.
 
+    The price cap is applied in SQL, so the limit counts only parts under it.
+
+    Results are cached per process and expire after RESULT_CACHE_TTL seconds.
+
     Args:
         min_reviews: Minimum number of reviews required
         limit: Maximum number of results
+        max_price: Optional price cap; only parts priced below it are returned
 
     Returns:
         List of top-rated parts
@@ -263,36 +372,44 @@ def get_top_rated_parts(min_reviews: int = 5, limit: int = 20) -> List[Dict]:
     Example:
         >>> top_parts = get_top_rated_parts(min_reviews=10)
         >>> print(f"Top part: {top_parts[0]['part_name']}")
+        >>> affordable = get_top_rated_parts(min_reviews=50, max_price=50)
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    # Copy the rows so callers can't mutate the cached ones
+    return [dict(row) for row in _fetch_top_rated_parts(min_reviews, limit, max_price)]
 
-    query = """
-    SELECT
-        part_id,
-        part_name,
-        manufacturer_part_number,
-        brand,
-        current_price,
-        rating,
-        review_count,
-        description,
-        installation_difficulty,
-        product_url
-    FROM parts
-    WHERE rating IS NOT NULL
-      AND review_count >= %s
-    ORDER BY rating DESC, review_count DESC
-    LIMIT %s;
-    """
 
-    cursor.execute(query, (min_reviews, limit))
-    results = cursor.fetchall()
+@cached(cache=_top_rated_cache, key=hashkey, lock=_cache_lock)
+def _fetch_top_rated_parts(min_reviews: int, limit: int, max_price: Optional[float]) -> List[Dict]:
+    """Run the get_top_rated_parts query; results are shared through the cache."""
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        query = """
+        SELECT
+            part_id,
+            part_name,
+            manufacturer_part_number,
+            brand,
+            current_price,
+            rating,
+            review_count,
+            description,
+            installation_difficulty,
+            product_url
+        FROM parts
+        WHERE rating IS NOT NULL
+          AND review_count >= %(min_reviews)s
+          AND (%(max_price)s::numeric IS NULL OR current_price < %(max_price)s)
+        ORDER BY rating DESC, review_count DESC
+        LIMIT %(limit)s;
+        """
 
-    cursor.close()
-    conn.close()
+        cursor.execute(
+            query,
+            {'min_reviews': min_reviews, 'max_price': max_price, 'limit': limit},
+            prepare=True
+        )
+        results = cursor.fetchall()
 
-    return [dict(row) for row in results]
+    return results
 
 
 # ==========================================
@@ -312,35 +429,58 @@ def get_part_details(part_id: str) -> Optional[Dict]:
         >>> part = get_part_details('123e4567-e89b-12d3-a456-426614174000')
         >>> print(part['description'])
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
-        p.*,
-        COALESCE(
-            json_agg(
-                json_build_object(
-                    'model_number', m.model_number,
-                    'model_url', m.model_url
-                )
-            ) FILTER (WHERE m.model_id IS NOT NULL),
-            '[]'::json
-        ) as compatible_models
-    FROM parts p
-    LEFT JOIN part_model_mapping pmm ON p.part_id = pmm.part_id
-    LEFT JOIN models m ON pmm.model_id = m.model_id
-    WHERE p.part_id = %s
-    GROUP BY p.part_id;
-    """
-
-    cursor.execute(query, (part_id,))
-    result = cursor.fetchone()
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        # Explicit columns skip the search_tsv vector; models come from a
+        # correlated subquery over covering indexes instead of a GROUP BY
+        query = """
+        SELECT
+            p.part_id,
+            p.part_name,
+            p.manufacturer_part_number,
+            p.part_number,
+            p.brand,
+            p.appliance_type,
+            p.current_price,
+            p.original_price,
+            p.has_discount,
+            p.discount_percentage,
+            p.rating,
+            p.review_count,
+            p.description,
+            p.symptoms,
+            p.replacement_parts,
+            p.installation_difficulty,
+            p.installation_time,
+            p.delivery_time,
+            p.availability,
+            p.image_url,
+            p.video_url,
+            p.product_url,
+            p.compatible_models_count,
+            p.created_at,
+            p.updated_at,
+            COALESCE(
+                (
+                    SELECT json_agg(
+                        json_build_object(
+                            'model_number', m.model_number,
+                            'model_url', m.model_url
+                        )
+                    )
+                    FROM part_model_mapping pmm
+                    JOIN models m ON pmm.model_id = m.model_id
+                    WHERE pmm.part_id = p.part_id
+                ),
+                '[]'::json
+            ) as compatible_models
+        FROM parts p
+        WHERE p.part_id = %s;
+        """
 
-    cursor.close()
-    conn.close()
+        cursor.execute(query, (part_id,), prepare=True)
+        result = cursor.fetchone()
 
-    return dict(result) if result else None
+    return result
 
 
 # ==========================================
@@ -361,107 +501,126 @@ def get_parts_with_videos(difficulty: Optional[str] = None, limit: int = 20) ->
         >>> easy_parts = get_parts_with_videos(difficulty='Easy')
         >>> print(f"Found {len(easy_parts)} easy-to-install parts with videos")
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    if difficulty:
-        query = """
-        SELECT
-            part_id,
-            part_name,
-            manufacturer_part_number,
-            current_price,
-            installation_difficulty,
-            installation_time,
-            video_url,
-            rating,
-            product_url
-        FROM parts
-        WHERE video_url IS NOT NULL
-          AND video_url != ''
-          AND installation_difficulty ILIKE %s
-        ORDER BY rating DESC NULLS LAST
-        LIMIT %s;
-        """
-        cursor.execute(query, (f'%{difficulty}%', limit))
-    else:
-        query = """
-        SELECT
-            part_id,
-            part_name,
-            manufacturer_part_number,
-            current_price,
-            installation_difficulty,
-            installation_time,
-            video_url,
-            rating,
-            product_url
-        FROM parts
-        WHERE video_url IS NOT NULL
-          AND video_url != ''
-        ORDER BY
-            CASE installation_difficulty
-                WHEN 'Really Easy' THEN 1
-                WHEN 'Easy' THEN 2
-                WHEN 'Moderate' THEN 3
-                ELSE 4
-            END,
-            rating DESC NULLS LAST
-        LIMIT %s;
-        """
-        cursor.execute(query, (limit,))
-
-    results = cursor.fetchall()
-
-    cursor.close()
-    conn.close()
-
-    return [dict(row) for row in results]
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        if difficulty:
+            query = """
+            SELECT
+                part_id,
+                part_name,
+                manufacturer_part_number,
+                current_price,
+                installation_difficulty,
+                installation_time,
+                video_url,
+                rating,
+                product_url
+            FROM parts
+            WHERE video_url IS NOT NULL
+              AND video_url != ''
+              AND installation_difficulty ILIKE %s
+            ORDER BY rating DESC NULLS LAST
+            LIMIT %s;
+            """
+            cursor.execute(query, (f'%{difficulty}%', limit), prepare=True)
+        else:
+            query = """
+            SELECT
+                part_id,
+                part_name,
+                manufacturer_part_number,
+                current_price,
+                installation_difficulty,
+                installation_time,
+                video_url,
+                rating,
+                product_url
+            FROM parts
+            WHERE video_url IS NOT NULL
+              AND video_url != ''
+            ORDER BY
+                CASE installation_difficulty
+                    WHEN 'Really Easy' THEN 1
+                    WHEN 'Easy' THEN 2
+                    WHEN 'Moderate' THEN 3
+                    ELSE 4
+                END,
+                rating DESC NULLS LAST
+            LIMIT %s;
+            """
+            cursor.execute(query, (limit,), prepare=True)
+
+        results = cursor.fetchall()
+
+    return results
 
 
 # ==========================================
 # QUERY 8: Find Replacement Parts
 # ==========================================
-def find_replacement_parts(part_number: str) -> List[Dict]:
+REPLACEMENT_PARTS_QUERY = """
+SELECT
+    part_id,
+    part_name,
+    manufacturer_part_number,
+    replacement_parts,
+    current_price,
+    rating,
+    review_count,
+    product_url
+FROM parts
+WHERE replacement_parts LIKE %s
+   OR manufacturer_part_number = %s
+ORDER BY rating DESC NULLS LAST
+LIMIT %s;
+"""
+
+# Rows fetched per round trip when streaming replacement parts
+STREAM_ITERSIZE = 200
+
+
+def find_replacement_parts(
+    part_number: str,
+    limit: Optional[int] = 50
+) -> Union[List[Dict], Iterator[Dict]]:
     """
     Find alternative/replacement parts for a given part number.
 
+    With limit=None every match is streamed from a server-side cursor in
+    batches of STREAM_ITERSIZE rows, so popular part numbers don't load the
+    whole result into memory. The pooled connection is held until the
+    iterator is exhausted or closed.
+
     Args:
         part_number: The original part number
+        limit: Maximum number of results, or None to stream all matches
 
     Returns:
-        List of replacement parts
+        List of replacement parts, or an iterator of them when limit is None
 
     Example:
         >>> replacements = find_replacement_parts('240534701')
         >>> print(f"Found {len(replacements)} replacement options")
+        >>> for part in find_replacement_parts('240534701', limit=None):
+        >>>     print(part['part_name'])
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    params = (f'%{part_number}%', part_number, limit)
 
-    query = """
-    SELECT
-        part_id,
-        part_name,
-        manufacturer_part_number,
-        replacement_parts,
-        current_price,
-        rating,
-        review_count,
-        product_url
-    FROM parts
-    WHERE replacement_parts LIKE %s
-       OR manufacturer_part_number = %s
-    ORDER BY rating DESC NULLS LAST;
-    """
+    if limit is None:
+        return _stream_replacement_parts(params)
+
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        cursor.execute(REPLACEMENT_PARTS_QUERY, params, prepare=True)
+        results = cursor.fetchall()
 
-    cursor.execute(query, (f'%{part_number}%', part_number))
-    results = cursor.fetchall()
+    return results
 
-    cursor.close()
-    conn.close()
 
-    return [dict(row) for row in results]
+def _stream_replacement_parts(params: tuple) -> Iterator[Dict]:
+    """Yield replacement parts from a named (server-side) cursor."""
+    with get_db_connection() as conn, conn.cursor(name='replacement_parts_stream', binary=True) as cursor:
+        cursor.itersize = STREAM_ITERSIZE
+        cursor.execute(REPLACEMENT_PARTS_QUERY, params)
+        yield from cursor
 
 
 # ==========================================
@@ -471,6 +630,11 @@ def get_database_stats() -> Dict:
     """
     Get summary statistics about the database.
 
+    Every parts aggregate comes from one scan of the parts table; models and
+    mappings are counted with scalar subqueries in the same statement.
+
+    Results are cached per process and expire after RESULT_CACHE_TTL seconds.
+
     Returns:
         Dictionary with database statistics
 
@@ -478,29 +642,32 @@ def get_database_stats() -> Dict:
         >>> stats = get_database_stats()
         >>> print(f"Total parts: {stats['total_parts']}")
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    query = """
-    SELECT
-        (SELECT COUNT(*) FROM parts) as total_parts,
-        (SELECT COUNT(*) FROM models) as total_models,
-        (SELECT COUNT(*) FROM part_model_mapping) as total_mappings,
-        (SELECT COUNT(*) FROM parts WHERE has_discount = TRUE) as discounted_parts,
-        (SELECT COUNT(*) FROM parts WHERE video_url IS NOT NULL AND video_url != '') as parts_with_videos,
-        (SELECT AVG(rating) FROM parts WHERE rating IS NOT NULL) as avg_rating,
-        (SELECT AVG(current_price) FROM parts) as avg_price,
-        (SELECT MIN(current_price) FROM parts WHERE current_price > 0) as min_price,
-        (SELECT MAX(current_price) FROM parts) as max_price;
-    """
+    # Copy so callers can't mutate the cached dict
+    return dict(_fetch_database_stats())
+
 
-    cursor.execute(query)
-    result = cursor.fetchone()
+@cached(cache=_stats_cache, key=hashkey, lock=_cache_lock)
+def _fetch_database_stats() -> Dict:
+    """Run the get_database_stats query; the result is shared through the cache."""
+    with get_db_connection() as conn, conn.cursor(binary=True) as cursor:
+        query = """
+        SELECT
+            COUNT(*) as total_parts,
+            (SELECT COUNT(*) FROM models) as total_models,
+            (SELECT COUNT(*) FROM part_model_mapping) as total_mappings,
+            COUNT(*) FILTER (WHERE has_discount) as discounted_parts,
+            COUNT(*) FILTER (WHERE video_url IS NOT NULL AND video_url != '') as parts_with_videos,
+            AVG(rating) as avg_rating,
+            AVG(current_price) as avg_price,
+            MIN(current_price) FILTER (WHERE current_price > 0) as min_price,
+            MAX(current_price) as max_price
+        FROM parts;
+        """
 
-    cursor.close()
-    conn.close()
+        cursor.execute(query, prepare=True)
+        result = cursor.fetchone()
 
-    return dict(result) if result else {}
+    return result or {}
 
 
 # ==========================================
@@ -4,6 +4,9 @@
 -- Enable UUID extension for unique IDs
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable trigram matching for substring (ILIKE '%term%') searches
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- ==========================================
 -- TABLE 1: Parts
 -- ==========================================
@@ -52,6 +55,11 @@ CREATE TABLE IF NOT EXISTS parts (
     video_url TEXT,
     product_url TEXT NOT NULL,
 
+    -- Full-text search over symptoms and description
+    search_tsv TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(symptoms, '') || ' ' || coalesce(description, ''))
+    ) STORED,
+
     -- Metadata
     compatible_models_count INTEGER DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -104,18 +112,46 @@ CREATE TABLE IF NOT EXISTS part_model_mapping (
 CREATE INDEX idx_parts_appliance_type ON parts(appliance_type);
 CREATE INDEX idx_parts_brand ON parts(brand);
 CREATE INDEX idx_parts_price ON parts(current_price);
-CREATE INDEX idx_parts_discount ON parts(has_discount) WHERE has_discount = TRUE;
-CREATE INDEX idx_parts_rating ON parts(rating DESC);
 CREATE INDEX idx_parts_manufacturer_part_number ON parts(manufacturer_part_number);
-CREATE INDEX idx_parts_symptoms ON parts USING gin(to_tsvector('english', symptoms));
-CREATE INDEX idx_parts_description ON parts USING gin(to_tsvector('english', description));
+CREATE INDEX idx_parts_mpn_pattern ON parts(upper(manufacturer_part_number) text_pattern_ops);
+CREATE INDEX idx_parts_part_number_pattern ON parts(upper(part_number) text_pattern_ops);
+CREATE INDEX idx_parts_search_tsv ON parts USING gin(search_tsv);
+CREATE INDEX idx_parts_name_tsv ON parts USING gin(to_tsvector('english', part_name));
+
+-- Partial indexes in the sort order of the listing queries, so LIMIT reads
+-- the first rows of the index instead of sorting every match
+CREATE INDEX idx_parts_discount ON parts(discount_percentage DESC, rating DESC NULLS LAST) WHERE has_discount;
+CREATE INDEX idx_parts_rating ON parts(rating DESC, review_count DESC) WHERE rating IS NOT NULL;
+CREATE INDEX idx_parts_video_rating ON parts(rating DESC NULLS LAST) WHERE video_url IS NOT NULL AND video_url <> '';
+-- get_parts_with_videos without a difficulty filter orders easiest first
+CREATE INDEX idx_parts_video_difficulty ON parts((
+    CASE installation_difficulty
+        WHEN 'Really Easy' THEN 1
+        WHEN 'Easy' THEN 2
+        WHEN 'Moderate' THEN 3
+        ELSE 4
+    END
+), rating DESC NULLS LAST) WHERE video_url IS NOT NULL AND video_url <> '';
+
+-- Trigram indexes for ILIKE/LIKE '%term%' substring searches
+CREATE INDEX idx_parts_name_trgm ON parts USING gin(part_name gin_trgm_ops);
+-- (part numbers are searched as upper(...) LIKE, so index the same expression)
+CREATE INDEX idx_parts_mpn_trgm ON parts USING gin(upper(manufacturer_part_number) gin_trgm_ops);
+CREATE INDEX idx_parts_part_number_trgm ON parts USING gin(upper(part_number) gin_trgm_ops);
+CREATE INDEX idx_parts_replacement_parts_trgm ON parts USING gin(replacement_parts gin_trgm_ops);
 
 -- Models table indexes
 CREATE INDEX idx_models_model_number ON models(model_number);
+CREATE INDEX idx_models_upper ON models(upper(model_number));
 CREATE INDEX idx_models_brand ON models(brand);
+-- Covers the compatible-models lookup in get_part_details (index-only scan)
+CREATE INDEX idx_models_id_include ON models(model_id) INCLUDE (model_number, model_url);
 
 -- Part-Model mapping indexes
-CREATE INDEX idx_mapping_part_id ON part_model_mapping(part_id);
+-- No separate part_id index: part_id leads the UNIQUE (part_id, model_id)
+-- index, which serves every part_id lookup (get_part_details, the
+-- parts_with_models view, ON DELETE CASCADE) and covers model_id, so
+-- get_part_details reads it with an index-only scan
 CREATE INDEX idx_mapping_model_id ON part_model_mapping(model_id);
 
 -- ==========================================
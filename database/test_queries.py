@@ -78,8 +78,7 @@ for part in top_parts:
 # Test 7: Complex Query - Affordable Parts with Good Ratings
 print("\n7️⃣  BEST VALUE (High Rating + Low Price)")
 print("-" * 60)
-top = get_top_rated_parts(min_reviews=50, limit=20)
-affordable = [p for p in top if p['current_price'] < 50]
+affordable = get_top_rated_parts(min_reviews=50, max_price=50, limit=20)
 print(f"   Found {len(affordable)} highly-rated parts under $50\n")
 for part in affordable[:3]:
     print(f"   - {part['part_name'][:50]}")
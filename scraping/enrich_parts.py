@@ -4,15 +4,26 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import pandas as pd
-from bs4 import BeautifulSoup
+import asyncio
+import atexit
+import json
+import re
+import shutil
+import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import httpx
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+from selectolax.lexbor import LexborHTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-import time
+from selenium.common.exceptions import TimeoutException
 from utils.data_cleaner import DataCleaner
 from tqdm import tqdm
 
@@ -30,8 +41,31 @@ if TEST_MODE:
     df = df.head(TEST_SIZE)
     print(f"🧪 TEST MODE: Processing only {TEST_SIZE} parts")
 
+# HTTP client settings (product pages are server-rendered, no JS needed)
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT = 15
+MAX_CONNECTIONS = 32
+# Requests in flight at once (HTTP/2 multiplexes them over few connections)
+MAX_IN_FLIGHT = 16
+
+# Selenium fallback for pages the HTTP fetch could not enrich
+USE_BROWSER_FALLBACK = True
+BROWSER_WORKERS = 3
+
+# The 'replaces these' label is a bold div on product pages; scan all divs only if that misses
+REPLACES_LABEL_SELECTORS = ('div.bold', 'div')
+REPLACES_PATTERN = re.compile(r'replaces these', re.I)
+
 cleaner = DataCleaner()
 
+# One driver per worker thread, reused across URLs
+_thread_local = threading.local()
+_drivers = []
+_drivers_lock = threading.Lock()
+
+
 def create_selenium_driver():
     """Create a Selenium WebDriver with appropriate options."""
     chrome_options = Options()
@@ -39,210 +73,316 @@ def create_selenium_driver():
     chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--no-sandbox')
-    # chrome_options.add_argument('--headless')  # Uncomment for headless mode
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    # Return after DOMContentLoaded instead of waiting for every resource
+    chrome_options.page_load_strategy = 'eager'
 
     driver = webdriver.Chrome(options=chrome_options)
     return driver
 
-def enrich_part(idx, url):
-    """Fetch and extract details from product page using Selenium."""
-    driver = create_selenium_driver()
-    try:
-        driver.get(url)
 
-        # Wait for page to load
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-
-        # Small delay to ensure JS renders
-        time.sleep(2)
-
-        # Get page source after JS execution
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, 'lxml')
-
-        # Extract manufacturer part number from URL
-        # Format: PS12115595-Samsung-DA97-15217D-Ice-Maker-Assembly.htm
-        manufacturer_part_number = ''
-        if url:
-            filename = url.split('/')[-1].split('?')[0].replace('.htm', '')
-            parts = filename.split('-')
-            if len(parts) >= 4:
-                # Check if parts[3] is part of the manufacturer number (starts with digit/letter combo)
-                if parts[3] and (parts[3][0].isdigit() or (len(parts[3]) < 8 and parts[3][0].isupper())):
-                    manufacturer_part_number = parts[2] + '-' + parts[3]
-                else:
-                    manufacturer_part_number = parts[2]
-            elif len(parts) >= 3:
-                manufacturer_part_number = parts[2]
+def get_thread_driver():
+    """Return this thread's WebDriver, creating it on first use."""
+    driver = getattr(_thread_local, 'driver', None)
+    if driver is None:
+        driver = create_selenium_driver()
+        _thread_local.driver = driver
+        with _drivers_lock:
+            _drivers.append(driver)
+    return driver
+
 
-        # Extract brand from Model Cross Reference section (full name like "General Electric")
-        brand = ''
-        crossref_brand = soup.select_one('.pd__crossref__list .row div')
-        if crossref_brand:
-            brand = crossref_brand.get_text().strip()
-
-        # Extract price - handle both current and original (if discount exists)
-        current_price = 0.0
-        original_price = 0.0
-
-        # Get current price (always shown)
-        price_elem = soup.select_one('.pd__price')
-        if price_elem:
-            current_price = cleaner.clean_price(price_elem.get_text())
-            original_price = current_price  # Default: original = current
-
-        # Check for strikethrough/original price (indicates discount)
-        original_elem = soup.select_one('.pd__price--original, .price--was, del, strike, [class*="original-price"]')
-        if original_elem:
-            orig_price = cleaner.clean_price(original_elem.get_text())
-            if orig_price and orig_price > current_price:
-                original_price = orig_price
-
-        # Extract rating from meta tag
-        rating = None
-        rating_meta = soup.select_one('meta[itemprop="ratingValue"]')
-        if rating_meta:
+@atexit.register
+def quit_drivers():
+    """Quit every WebDriver created by the worker threads."""
+    with _drivers_lock:
+        for driver in _drivers:
             try:
-                rating = float(rating_meta.get('content', ''))
-            except (ValueError, TypeError):
-                rating = None
-
-        # Extract reviews
-        review_elem = soup.select_one('.reviews, [class*="review"]')
-        reviews = cleaner.clean_review_count(review_elem.get_text() if review_elem else '')
-
-        # Extract description
-        desc_elem = soup.select_one('.description, .part-description, [class*="description"]')
-        description = desc_elem.get_text().strip() if desc_elem else ''
-
-        # Extract symptoms from Customer Repair Stories
-        symptoms = []
-        repair_story_titles = soup.select('.repair-story__title')
-        for title_elem in repair_story_titles[:10]:
-            symptom_text = title_elem.get_text().strip()
-            if symptom_text and len(symptom_text) > 10:
-                symptoms.append(symptom_text)
-
-        # Extract installation difficulty and time (SEPARATED)
-        install_difficulty = ''
-        install_time = ''
-
-        repair_container = soup.select_one('.pd__repair-rating__container')
-        if repair_container:
-            bold_elements = repair_container.find_all('p', class_='bold')
-            for p_elem in bold_elements:
-                text = p_elem.get_text().strip()
-                if 'min' in text.lower() or 'hour' in text.lower():
-                    install_time = text
-                elif any(word in text.lower() for word in ['easy', 'moderate', 'difficult', 'hard']):
-                    install_difficulty = text
-
-        # Extract replacement part numbers
-        replacement_parts = []
-        replace_section = soup.find(string=lambda t: t and 'replaces these' in t.lower())
-        if replace_section:
-            parent_div = replace_section.find_parent('div')
-            if parent_div:
-                data_div = parent_div.find_next_sibling('div')
-                if data_div:
-                    parts_text = data_div.get_text().strip()
-                    if parts_text:
-                        replacement_parts = [p.strip() for p in parts_text.split(',') if p.strip()][:10]
-
-        # Extract compatible model numbers
-        compatible_models = []
-        crossref_list = soup.select('.pd__crossref__list .row')
-        for row in crossref_list:
-            model_link = row.select_one('a[href*="/Models/"]')
-            if model_link:
-                model_number = model_link.get_text().strip()
-                model_url = 'https://www.partselect.com' + model_link.get('href', '')
-                if model_number:
-                    compatible_models.append({
-                        'model_number': model_number,
-                        'model_url': model_url
-                    })
-
-        # Extract video URL
-        video_url = ''
-        yt_elem = soup.select_one('[data-yt-init]')
-        if yt_elem:
-            yt_id = yt_elem.get('data-yt-init', '')
-            if yt_id:
-                video_url = f'https://www.youtube.com/watch?v={yt_id}'
-
-        if not video_url:
-            video_iframes = soup.select('iframe[src*="youtube"], iframe[src*="vimeo"], iframe[src*="youtu.be"]')
-            if video_iframes:
-                video_url = video_iframes[0].get('src', '')
-
-        result = {
-            'manufacturer_part_number': manufacturer_part_number,
-            'brand': brand,
-            'current_price': current_price,
-            'original_price': original_price,
-            'rating': rating,
-            'review_count': reviews,
-            'description': description,
-            'symptoms': ' | '.join(symptoms) if symptoms else '',
-            'replacement_parts': ' | '.join(replacement_parts) if replacement_parts else '',
-            'installation_difficulty': install_difficulty,
-            'installation_time': install_time,
-            'video_url': video_url,
-            'compatible_models': compatible_models,
-            'compatible_models_count': len(compatible_models),
-        }
-
-        driver.quit()
-        return idx, result
+                driver.quit()
+            except Exception:
+                pass
+        _drivers.clear()
+
+
+def _is_inside(node, ancestor):
+    """Return whether node is a descendant of ancestor."""
+    parent = node.parent
+    while parent is not None:
+        if parent == ancestor:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _replacement_label(tree):
+    """
+    Return the innermost div whose text says 'replaces these', checking bold
+    labels before every div. The label may be wrapped (e.g. in <span> or <b>).
+    """
+    for selector in REPLACES_LABEL_SELECTORS:
+        label_div = None
+        for div in tree.css(selector):
+            if not REPLACES_PATTERN.search(div.text()):
+                continue
+            # Divs come in document order: a match inside the current one is
+            # closer to the label, and the first match outside it ends the search
+            if label_div is not None and not _is_inside(div, label_div):
+                break
+            label_div = div
+        if label_div is not None:
+            return label_div
+    return None
+
+
+def find_replacement_parts(tree):
+    """Find the comma-separated part numbers listed after 'replaces these'."""
+    label_div = _replacement_label(tree)
+    if label_div is None:
+        return []
+
+    # The next sibling div holds the part numbers
+    data_div = label_div.next
+    while data_div is not None and data_div.tag != 'div':
+        data_div = data_div.next
+    if data_div is None:
+        return []
+
+    parts_text = data_div.text().strip()
+    return [p.strip() for p in parts_text.split(',') if p.strip()][:10]
+
+
+def parse_product_page(html, url):
+    """
+    Extract part details from a product page's HTML.
+    Returns {} when the page has no price block (e.g. a bot challenge or
+    interstitial), so it counts as a failed fetch instead of overwriting data.
+    """
+    tree = LexborHTMLParser(html)
+
+    # Every product page shows a price; anything else isn't the page we asked for
+    price_elem = tree.css_first('.pd__price')
+    if price_elem is None:
+        return {}
+
+    # Extract manufacturer part number from URL
+    # Format: PS12115595-Samsung-DA97-15217D-Ice-Maker-Assembly.htm
+    manufacturer_part_number = ''
+    if url:
+        filename = url.split('/')[-1].split('?')[0].replace('.htm', '')
+        parts = filename.split('-')
+        if len(parts) >= 4:
+            # Check if parts[3] is part of the manufacturer number (starts with digit/letter combo)
+            if parts[3] and (parts[3][0].isdigit() or (len(parts[3]) < 8 and parts[3][0].isupper())):
+                manufacturer_part_number = parts[2] + '-' + parts[3]
+            else:
+                manufacturer_part_number = parts[2]
+        elif len(parts) >= 3:
+            manufacturer_part_number = parts[2]
+
+    # Extract brand from Model Cross Reference section (full name like "General Electric")
+    brand = ''
+    crossref_brand = tree.css_first('.pd__crossref__list .row div')
+    if crossref_brand:
+        brand = crossref_brand.text().strip()
+
+    # Extract price - handle both current and original (if discount exists)
+    # Get current price (always shown)
+    current_price = cleaner.clean_price(price_elem.text())
+    original_price = current_price  # Default: original = current
+
+    # Check for strikethrough/original price (indicates discount)
+    original_elem = tree.css_first('.pd__price--original, .price--was, del, strike, [class*="original-price"]')
+    if original_elem:
+        orig_price = cleaner.clean_price(original_elem.text())
+        if orig_price and orig_price > current_price:
+            original_price = orig_price
+
+    # Extract rating from meta tag
+    rating = None
+    rating_meta = tree.css_first('meta[itemprop="ratingValue"]')
+    if rating_meta:
+        try:
+            rating = float(rating_meta.attributes.get('content') or '')
+        except (ValueError, TypeError):
+            rating = None
+
+    # Extract reviews
+    review_elem = tree.css_first('.reviews, [class*="review"]')
+    reviews = cleaner.clean_review_count(review_elem.text() if review_elem else '')
+
+    # Extract description
+    desc_elem = tree.css_first('.description, .part-description, [class*="description"]')
+    description = desc_elem.text().strip() if desc_elem else ''
+
+    # Extract symptoms from Customer Repair Stories
+    symptoms = []
+    for title_elem in tree.css('.repair-story__title')[:10]:
+        symptom_text = title_elem.text().strip()
+        if symptom_text and len(symptom_text) > 10:
+            symptoms.append(symptom_text)
+
+    # Extract installation difficulty and time (SEPARATED)
+    install_difficulty = ''
+    install_time = ''
+
+    repair_container = tree.css_first('.pd__repair-rating__container')
+    if repair_container:
+        for p_elem in repair_container.css('p.bold'):
+            text = p_elem.text().strip()
+            if 'min' in text.lower() or 'hour' in text.lower():
+                install_time = text
+            elif any(word in text.lower() for word in ['easy', 'moderate', 'difficult', 'hard']):
+                install_difficulty = text
+
+    # Extract replacement part numbers
+    replacement_parts = find_replacement_parts(tree)
+
+    # Extract compatible model numbers
+    compatible_models = []
+    for row in tree.css('.pd__crossref__list .row'):
+        model_link = row.css_first('a[href*="/Models/"]')
+        if model_link:
+            model_number = model_link.text().strip()
+            model_url = 'https://www.partselect.com' + (model_link.attributes.get('href') or '')
+            if model_number:
+                compatible_models.append({
+                    'model_number': model_number,
+                    'model_url': model_url
+                })
+
+    # Extract video URL
+    video_url = ''
+    yt_elem = tree.css_first('[data-yt-init]')
+    if yt_elem:
+        yt_id = yt_elem.attributes.get('data-yt-init') or ''
+        if yt_id:
+            video_url = f'https://www.youtube.com/watch?v={yt_id}'
+
+    if not video_url:
+        video_iframe = tree.css_first('iframe[src*="youtube"], iframe[src*="vimeo"], iframe[src*="youtu.be"]')
+        if video_iframe:
+            video_url = video_iframe.attributes.get('src') or ''
+
+    return {
+        'manufacturer_part_number': manufacturer_part_number,
+        'brand': brand,
+        'current_price': current_price,
+        'original_price': original_price,
+        'rating': rating,
+        'review_count': reviews,
+        'description': description,
+        'symptoms': ' | '.join(symptoms) if symptoms else '',
+        'replacement_parts': ' | '.join(replacement_parts) if replacement_parts else '',
+        'installation_difficulty': install_difficulty,
+        'installation_time': install_time,
+        'video_url': video_url,
+        'compatible_models': compatible_models,
+        'compatible_models_count': len(compatible_models),
+    }
+
+
+async def enrich_part(client, semaphore, idx, url):
+    """Fetch a product page over HTTP and extract its details."""
+    try:
+        async with semaphore:
+            response = await client.get(url)
+        response.raise_for_status()
+        return idx, parse_product_page(response.text, url)
 
     except Exception as e:
         print(f"  ⚠️  Error on {url}: {e}")
-        driver.quit()
         return idx, {}
 
-# Parallel enrichment with Selenium
-print(f"\n⚡ Fetching {len(df)} product pages with Selenium + BeautifulSoup...")
-updates = {}
 
-with ThreadPoolExecutor(max_workers=3) as executor:
-    futures = {
-        executor.submit(enrich_part, idx, row['product_url']): idx
-        for idx, row in df.iterrows()
-        if pd.notna(row['product_url'])
-    }
+def enrich_part_with_browser(idx, url):
+    """Fetch a product page with Selenium (JS rendering) and extract its details."""
+    driver = get_thread_driver()
+    try:
+        driver.get(url)
+
+        # Wait until the price renders; parse whatever loaded if it never does
+        try:
+            WebDriverWait(driver, 5).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '.pd__price'))
+            )
+        except TimeoutException:
+            pass
 
-    for future in tqdm(as_completed(futures), total=len(futures), desc="Enriching"):
-        idx, data = future.result()
-        if data:
-            updates[idx] = data
+        return idx, parse_product_page(driver.page_source, url)
+
+    except Exception as e:
+        print(f"  ⚠️  Browser error on {url}: {e}")
+        return idx, {}
+
+
+async def enrich_all(targets):
+    """Fetch all product pages concurrently over a shared HTTP/2 client."""
+    results = {}
+    limits = httpx.Limits(max_connections=MAX_CONNECTIONS)
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=REQUEST_HEADERS,
+        timeout=REQUEST_TIMEOUT,
+        limits=limits,
+        follow_redirects=True
+    ) as client:
+        tasks = [enrich_part(client, semaphore, idx, url) for idx, url in targets]
+        for next_result in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Enriching"):
+            idx, data = await next_result
+            if data:
+                results[idx] = data
+
+    return results
+
+
+# Concurrent enrichment over HTTP
+print(f"\n⚡ Fetching {len(df)} product pages with httpx + selectolax...")
+targets = [
+    (idx, row['product_url'])
+    for idx, row in df.iterrows()
+    if pd.notna(row['product_url'])
+]
+updates = asyncio.run(enrich_all(targets))
+
+# Retry pages the HTTP pass missed with a real browser
+retry_targets = [(idx, url) for idx, url in targets if idx not in updates]
+if USE_BROWSER_FALLBACK and retry_targets:
+    print(f"\n🌐 Retrying {len(retry_targets)} pages with Selenium...")
+    with ThreadPoolExecutor(max_workers=BROWSER_WORKERS) as executor:
+        futures = [executor.submit(enrich_part_with_browser, idx, url) for idx, url in retry_targets]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Browser fallback"):
+            idx, data = future.result()
+            if data:
+                updates[idx] = data
+    quit_drivers()
 
 # Update dataframe
 print(f"\n💾 Updating {len(updates)} parts...")
-import json
 
 string_cols = ['manufacturer_part_number', 'brand', 'description', 'symptoms', 'replacement_parts', 'installation_difficulty', 'installation_time', 'video_url', 'compatible_models_json']
 numeric_cols = ['current_price', 'original_price', 'rating', 'review_count', 'compatible_models_count']
 
-for col in string_cols + numeric_cols:
+for col in numeric_cols:
     if col not in df.columns:
-        if col in string_cols:
-            df[col] = ''
-        else:
-            df[col] = 0
+        df[col] = 0
 
+# Nullable string columns, allocated once so updates don't upcast cell by cell
 for col in string_cols:
-    if col in df.columns:
-        df[col] = df[col].astype('object')
-
-for idx, data in updates.items():
-    for key, value in data.items():
-        if key == 'compatible_models':
-            df.at[idx, 'compatible_models_json'] = json.dumps(value) if value else ''
-        else:
-            df.at[idx, key] = value
+    df[col] = pd.array(df[col] if col in df.columns else [''] * len(df), dtype='string')
+
+# Stage all updates in one frame and write them back in a single aligned assignment
+# (not df.update, which skips NaN and would keep a stale rating when a page has none)
+staging = pd.DataFrame.from_dict(updates, orient='index')
+if not staging.empty:
+    staging['compatible_models_json'] = staging.pop('compatible_models').map(
+        lambda models: json.dumps(models) if models else ''
+    )
+    staging = staging.astype(df.dtypes[staging.columns].to_dict())
+    df.loc[staging.index, staging.columns] = staging
 
 # Save
 if TEST_MODE:
@@ -250,8 +390,14 @@ if TEST_MODE:
     df.to_csv(test_output, index=False)
     print(f"\n💾 Test results saved to: {test_output}")
 else:
-    df.to_csv('data/processed/parts_latest.csv', index=False)
-    df.to_csv(f'data/processed/parts_enriched_{pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")}.csv', index=False)
+    # Serialize once with Arrow's C writer; the timestamped CSV is a byte copy
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pacsv.write_csv(table, 'data/processed/parts_latest.csv')
+    pq.write_table(table, 'data/processed/parts_latest.parquet', compression='zstd')
+    shutil.copyfile(
+        'data/processed/parts_latest.csv',
+        f'data/processed/parts_enriched_{pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")}.csv'
+    )
 
 print("\n✅ Enrichment complete!")
 print(f"   💰 Parts with price: {df['current_price'].notna().sum()}/{len(df)} ({(df['current_price'] > 0).sum()} non-zero)")
@@ -3,107 +3,117 @@ Processing script to clean up RAG documents by removing unnecessary fields
 and extracting topic information from blogs.
 """
 
-import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Tuple
 
+import ijson
+import orjson
+
+from process_rag_fast import process_blog, process_part
+
+
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
-def extract_topic_from_url(topic_source: str) -> str:
-    """
-    Extract topic from topic_source URL.
-    Example: https://www.partselect.com/blog/topics/repair -> repair
-    """
-    if not topic_source:
-        return ""
-    
-    # Get the last segment of the URL path
-    path_segments = topic_source.rstrip('/').split('/')
-    if path_segments:
-        return path_segments[-1]
-    return ""
 
+def process_parts_json(data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily process parts records (see process_part)."""
+    return map(process_part, data)
 
-def process_parts_json(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+def process_blogs_json(data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    """Lazily process blog records (see process_blog)."""
+    return map(process_blog, data)
+
+
+def write_json_array(items: Iterable[Dict[str, Any]], f: BinaryIO) -> int:
     """
-    Process parts JSON files by removing unnecessary fields.
-    
-    Removes: part_id, difficulty, repair_time, has_video, video_urls, video_count, scraped_at
+    Write records as a 2-space indented JSON array, one record at a time.
+
+    The output matches json.dump(items, indent=2, ensure_ascii=False).
+
+    Args:
+        items: Records to write
+        f: File opened in binary mode
+
+    Returns:
+        Number of records written
     """
-    fields_to_remove = [
-        'part_id', 'difficulty', 'repair_time', 
-        'has_video', 'video_urls', 'video_count', 'scraped_at'
-    ]
-    
-    processed_data = []
-    for item in data:
-        processed_item = {k: v for k, v in item.items() if k not in fields_to_remove}
-        processed_data.append(processed_item)
-    
-    return processed_data
+    count = 0
+    for item in items:
+        f.write(b'[\n  ' if count == 0 else b',\n  ')
+        # JSON strings never contain raw newlines, so this only indents structure
+        f.write(orjson.dumps(item, option=JSON_OPTIONS).replace(b'\n', b'\n  '))
+        count += 1
+
+    f.write(b'\n]' if count else b'[]')
+    return count
 
 
-def process_blogs_json(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+@contextmanager
+def atomic_output(output_path: Path) -> Iterator[BinaryIO]:
     """
-    Process blogs JSON files by removing unnecessary fields and adding topic.
-    
-    Removes: published_date, reading_time, categories, featured_image, images, 
-             image_count, related_parts, related_parts_count, video_urls, 
-             video_count, scraped_at
-    Adds: topic (extracted from topic_source)
+    Open a temp file next to output_path for binary writing, and move it into
+    place only when the block finishes without an error.
+
+    A failed write leaves any previous output_path untouched.
+
+    Args:
+        output_path: Final path of the file
     """
-    fields_to_remove = [
-        'published_date', 'reading_time', 'categories', 
-        'featured_image', 'images', 'image_count',
-        'related_parts', 'related_parts_count', 
-        'video_urls', 'video_count', 'scraped_at'
-    ]
-    
-    processed_data = []
-    for item in data:
-        # Remove unnecessary fields
-        processed_item = {k: v for k, v in item.items() if k not in fields_to_remove}
-        
-        # Extract and add topic from topic_source
-        if 'topic_source' in item:
-            processed_item['topic'] = extract_topic_from_url(item['topic_source'])
-        
-        processed_data.append(processed_item)
-    
-    return processed_data
+    tmp_path = output_path.with_name(f'.{output_path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            yield f
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
 
 
 def process_file(input_path: Path, output_path: Path, file_type: str) -> None:
     """
     Process a single JSON file.
-    
+
+    Records are parsed, transformed and written one at a time, so memory
+    use stays at about one record regardless of file size. The output only
+    replaces output_path once the whole input has been processed.
+
     Args:
         input_path: Path to input JSON file
         output_path: Path to output JSON file
         file_type: 'parts' or 'blogs'
     """
     print(f"Processing {input_path.name}...")
-    
-    # Read input file
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Process data based on type
+
     if file_type == 'parts':
-        processed_data = process_parts_json(data)
+        process = process_parts_json
     elif file_type == 'blogs':
-        processed_data = process_blogs_json(data)
+        process = process_blogs_json
     else:
         raise ValueError(f"Unknown file type: {file_type}")
-    
-    # Write output file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(processed_data, f, indent=2, ensure_ascii=False)
-    
-    print(f"  ✓ Processed {len(data)} items")
+
+    # Stream records from the input array straight into the output file
+    with open(input_path, 'rb') as f_in, atomic_output(output_path) as f_out:
+        count = write_json_array(process(ijson.items(f_in, 'item', use_float=True)), f_out)
+
+    print(f"  ✓ Processed {count} items")
     print(f"  ✓ Saved to {output_path}")
 
 
+def process_file_safely(job: Tuple[Path, Path, str]) -> None:
+    """Process one (input_path, output_path, file_type) job, reporting errors instead of raising."""
+    input_path, output_path, file_type = job
+    try:
+        process_file(input_path, output_path, file_type)
+        print()
+    except Exception as e:
+        print(f"  ✗ Error processing {input_path.name}: {e}")
+        print()
+
+
 def main():
     """Main processing function."""
     # Define paths
@@ -127,22 +137,22 @@ def main():
         ('refrigerator_blogs.json', 'blogs'),
     ]
     
-    # Process each file
+    # One directory listing instead of a stat per file
+    available = {entry.name for entry in os.scandir(rag_docs_dir)} if rag_docs_dir.is_dir() else set()
+
+    jobs = []
     for filename, file_type in files_to_process:
-        input_path = rag_docs_dir / filename
-        output_path = processed_dir / filename
-        
-        if input_path.exists():
-            try:
-                process_file(input_path, output_path, file_type)
-                print()
-            except Exception as e:
-                print(f"  ✗ Error processing {filename}: {e}")
-                print()
+        if filename in available:
+            jobs.append((rag_docs_dir / filename, processed_dir / filename, file_type))
         else:
             print(f"  ⚠ File not found: {filename}")
             print()
-    
+
+    # Files are independent, so parse them on separate cores
+    if jobs:
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+            list(executor.map(process_file_safely, jobs))
+
     print("=" * 60)
     print("Processing complete!")
     print(f"Processed files saved to: {processed_dir}")
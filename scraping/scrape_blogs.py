@@ -16,17 +16,26 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import pandas as pd
+import asyncio
+import atexit
+import threading
+import ahocorasick
+import httpx
+import lxml.html
+from cssselect import HTMLTranslator
+from lxml import etree
+from lxml.cssselect import CSSSelector
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
+import orjson
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from tqdm.asyncio import tqdm as async_tqdm
 import re
 
 print("📝 Scraping blog articles for refrigerators and dishwashers...\n")
@@ -50,35 +59,177 @@ DISHWASHER_KEYWORDS = [
     'dishwasher', 'dish washer', 'dishwashing'
 ]
 
+# One Aho-Corasick automaton over every keyword: each card's text is scanned
+# once, however many keywords there are
+KEYWORD_AUTOMATON = ahocorasick.Automaton()
+for keyword in REFRIGERATOR_KEYWORDS:
+    KEYWORD_AUTOMATON.add_word(keyword, 'refrigerator')
+for keyword in DISHWASHER_KEYWORDS:
+    KEYWORD_AUTOMATON.add_word(keyword, 'dishwasher')
+KEYWORD_AUTOMATON.make_automaton()
+
+# Article pages are static HTML: fetch them concurrently over one HTTP/2
+# client and only start Chrome when a page comes back with almost no text
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT = 10
+MIN_PAGE_TEXT_CHARS = 500
+MAX_CONNECTIONS = 32
+MAX_IN_FLIGHT = 16
+BROWSER_WORKERS = 3
+
+# Topic listing pages need Chrome; load up to this many at once
+TOPIC_WORKERS = 5
+
+# Chrome waits until the content each page is scraped for exists, at most PAGE_READY_TIMEOUT seconds.
+# Only the rendered content counts: the page shell (<main>, nav links to /blog/) is there
+# from the first paint, before the cards or article body have loaded
+PAGE_READY_TIMEOUT = 10
+TOPIC_READY_CSS = 'article, .blog-post, .post-card, [class*="article"]'
+ARTICLE_READY_CSS = 'article p, .article-content p, .post-content p, .content p, main p'
+
+def descendant_selector(css):
+    """Compile a CSS selector that matches below an element, not the element itself."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix='descendant::'))
+
+# Article selectors, compiled to XPath once instead of on every page
+SEL_TITLE = CSSSelector('h1, .article-title, .post-title', translator='html')
+SEL_AUTHOR = CSSSelector('.author, [class*="author"], [rel="author"]', translator='html')
+SEL_DATE = CSSSelector('time, .date, .published, [datetime]', translator='html')
+SEL_CATEGORIES = CSSSelector('.category, .tag, [rel="category"]', translator='html')
+SEL_FEATURED_IMAGE = CSSSelector('.featured-image img, article img, .post-image img', translator='html')
+SEL_IMAGES = CSSSelector('article img, .content img, .post-content img', translator='html')
+SEL_CONTENT = CSSSelector('article, .article-content, .post-content, .content, main', translator='html')
+SEL_PARAGRAPHS = CSSSelector('p', translator='html')
+SEL_READING_TIME = CSSSelector('.reading-time, [class*="read-time"]', translator='html')
+SEL_PART_LINKS = CSSSelector('a[href*="/PS"]', translator='html')
+SEL_VIDEOS = CSSSelector('iframe[src*="youtube"], iframe[src*="youtu.be"]', translator='html')
+SEL_META_DESCRIPTION = CSSSelector('meta[name="description"]', translator='html')
+
+# Topic page selectors; card-level ones search only inside the card
+SEL_CARDS = CSSSelector('article, .blog-post, .post-card, [class*="article"]', translator='html')
+SEL_BLOG_LINKS = CSSSelector('a[href*="/blog/"]', translator='html')
+SEL_NEXT_PAGE = CSSSelector('.next-page, .pagination .next, a[rel="next"]', translator='html')
+SEL_CARD_LINK = descendant_selector('a[href*="/blog/"]')
+SEL_CARD_TITLE = descendant_selector('h2, h3, h4, .title, .post-title, [class*="title"]')
+SEL_CARD_EXCERPT = descendant_selector('.excerpt, .description, p')
+
+# Chrome is slow to start, so each thread keeps one driver for the whole run
+_thread_local = threading.local()
+_drivers = []
+_drivers_lock = threading.Lock()
+
+# Built once at import and shared by every driver this module creates
+CHROME_OPTIONS = Options()
+for arg in (
+    '--disable-blink-features=AutomationControlled',
+    '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+):
+    CHROME_OPTIONS.add_argument(arg)
+# CHROME_OPTIONS.add_argument('--headless')  # Uncomment for headless mode
+
 def create_driver():
     """Create Selenium WebDriver with anti-detection."""
-    chrome_options = Options()
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--no-sandbox')
-    # chrome_options.add_argument('--headless')  # Uncomment for headless mode
+    return webdriver.Chrome(options=CHROME_OPTIONS)
+
+def get_thread_driver():
+    """Return this thread's WebDriver, creating it on first use."""
+    driver = getattr(_thread_local, 'driver', None)
+    if driver is None:
+        driver = create_driver()
+        _thread_local.driver = driver
+        with _drivers_lock:
+            _drivers.append(driver)
+    return driver
+
+@atexit.register
+def quit_drivers():
+    """Quit every WebDriver created by the worker threads."""
+    with _drivers_lock:
+        for driver in _drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        _drivers.clear()
 
-    return webdriver.Chrome(options=chrome_options)
+def select_one(tree, selector):
+    """Return the first element matching a compiled selector, or None."""
+    matches = selector(tree)
+    return matches[0] if matches else None
 
-def is_relevant_article(title, excerpt=''):
+def wait_for_css(driver, css):
     """
-    Check if article is about refrigerator or dishwasher.
-    Returns: ('refrigerator', True), ('dishwasher', True), or (None, False)
+    Wait until an element matching css is on the page, returning as soon as it is.
+    On timeout the page is used as loaded, so a page without it still gets parsed.
     """
-    combined_text = (title + ' ' + excerpt).lower()
-
-    # Check for refrigerator
-    for keyword in REFRIGERATOR_KEYWORDS:
-        if keyword in combined_text:
-            return 'refrigerator', True
+    try:
+        WebDriverWait(driver, PAGE_READY_TIMEOUT).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, css))
+        )
+    except TimeoutException:
+        pass
 
-    # Check for dishwasher
-    for keyword in DISHWASHER_KEYWORDS:
-        if keyword in combined_text:
-            return 'dishwasher', True
+def fetch_tree_with_browser(url):
+    """Load a JS-rendered page in this thread's Chrome and parse the result with lxml."""
+    driver = get_thread_driver()
+    driver.get(url)
+    wait_for_css(driver, ARTICLE_READY_CSS)
+    return lxml.html.fromstring(driver.page_source)
 
-    return None, False
+async def fetch_page_tree(client, browser_pool, url):
+    """
+    Fetch a page over HTTP and parse it with lxml.
+    Falls back to Selenium when the request fails (e.g. a blocked or erroring
+    response) or the HTML has too little text (JS-rendered).
+    """
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        pass
+    else:
+        tree = lxml.html.fromstring(response.content)
+        if len(tree.text_content().strip()) >= MIN_PAGE_TEXT_CHARS:
+            return tree
+
+    # Chrome blocks, so run it on the browser threads (each reuses its driver)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(browser_pool, fetch_tree_with_browser, url)
+
+def classify_appliance(title, excerpt=''):
+    """
+    Return 'refrigerator' or 'dishwasher' for an article, or None if neither matches.
+    Refrigerator wins when both match.
+    """
+    appliance_type = None
+    for _, kind in KEYWORD_AUTOMATON.iter(f"{title} {excerpt}".lower()):
+        if kind == 'refrigerator':
+            return kind
+        appliance_type = kind
+    return appliance_type
+
+def classify_articles(cards):
+    """
+    Keep only refrigerator and dishwasher articles from a topic page.
+    Returns: list of card dicts with 'appliance_type' added
+    """
+    relevant = []
+    for card in cards:
+        # Classify on the full excerpt, then keep only its first 200 characters
+        appliance_type = classify_appliance(card['title'], card['excerpt'])
+        if appliance_type:
+            relevant.append({
+                'url': card['url'],
+                'title': card['title'],
+                'excerpt': card['excerpt'][:200],
+                'appliance_type': appliance_type,
+                'topic_url': card['topic_url']
+            })
+    return relevant
 
 def scrape_blog_topic_urls(topic_url):
     """
@@ -86,29 +237,27 @@ def scrape_blog_topic_urls(topic_url):
     Only includes refrigerator and dishwasher articles.
     """
     print(f"\n📋 Scraping blog topic: {topic_url}")
-    driver = create_driver()
+    driver = get_thread_driver()
     blog_urls = []
+    cards = []
 
     try:
         driver.get(topic_url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(2)
+        wait_for_css(driver, TOPIC_READY_CSS)
 
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        tree = lxml.html.fromstring(driver.page_source)
 
         # Find all blog article cards/links
-        article_cards = soup.select('article, .blog-post, .post-card, [class*="article"]')
+        article_cards = SEL_CARDS(tree)
 
         if not article_cards:
             # Try alternative selectors
-            article_cards = soup.select('a[href*="/blog/"]')
+            article_cards = SEL_BLOG_LINKS(tree)
 
         for card in article_cards:
             # Get article link
-            link_elem = card if card.name == 'a' else card.select_one('a[href*="/blog/"]')
-            if not link_elem:
+            link_elem = card if card.tag == 'a' else select_one(card, SEL_CARD_LINK)
+            if link_elem is None:
                 continue
 
             article_url = link_elem.get('href', '')
@@ -119,28 +268,26 @@ def scrape_blog_topic_urls(topic_url):
                 article_url = 'https://www.partselect.com' + article_url
 
             # Get article title
-            title_elem = card.select_one('h2, h3, h4, .title, .post-title, [class*="title"]')
-            title = title_elem.get_text().strip() if title_elem else ''
+            title_elem = select_one(card, SEL_CARD_TITLE)
+            title = title_elem.text_content().strip() if title_elem is not None else ''
 
             # Get article excerpt/description
-            excerpt_elem = card.select_one('.excerpt, .description, p')
-            excerpt = excerpt_elem.get_text().strip() if excerpt_elem else ''
+            excerpt_elem = select_one(card, SEL_CARD_EXCERPT)
+            excerpt = excerpt_elem.text_content().strip() if excerpt_elem is not None else ''
 
-            # Check if relevant (refrigerator or dishwasher)
-            appliance_type, is_relevant = is_relevant_article(title, excerpt)
+            cards.append({
+                'url': article_url,
+                'title': title,
+                'excerpt': excerpt,
+                'topic_url': topic_url
+            })
 
-            if is_relevant:
-                blog_urls.append({
-                    'url': article_url,
-                    'title': title,
-                    'excerpt': excerpt[:200],
-                    'appliance_type': appliance_type,
-                    'topic_url': topic_url
-                })
+        # Keep only refrigerator and dishwasher articles
+        blog_urls = classify_articles(cards)
 
         # Handle pagination if exists
-        next_page = soup.select_one('.next-page, .pagination .next, a[rel="next"]')
-        if next_page and len(blog_urls) < 100:  # Limit to avoid infinite loop
+        next_page = select_one(tree, SEL_NEXT_PAGE)
+        if next_page is not None and len(blog_urls) < 100:  # Limit to avoid infinite loop
             next_url = next_page.get('href', '')
             if next_url and next_url not in topic_url:
                 if not next_url.startswith('http'):
@@ -152,174 +299,178 @@ def scrape_blog_topic_urls(topic_url):
 
     except Exception as e:
         print(f"   ❌ Error scraping blog topic: {e}")
-    finally:
-        driver.quit()
 
     return blog_urls
 
-def scrape_blog_article(blog_info):
-    """
-    Scrape full blog article content with metadata from website only.
-    Extracts: title, author, date, content, tags, images, etc.
-    """
-    driver = create_driver()
+async def scrape_blog_article(client, semaphore, browser_pool, blog_info):
+    """Fetch one blog article and extract its data (None on failure)."""
     url = blog_info['url']
 
     try:
-        driver.get(url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(2)
-
-        soup = BeautifulSoup(driver.page_source, 'lxml')
-
-        # Extract title
-        title = blog_info['title']
-        title_elem = soup.select_one('h1, .article-title, .post-title')
-        if title_elem:
-            title = title_elem.get_text().strip()
-
-        # Extract author
-        author = ''
-        author_elem = soup.select_one('.author, [class*="author"], [rel="author"]')
-        if author_elem:
-            author = author_elem.get_text().strip()
-
-        # Extract published date
-        published_date = ''
-        date_elem = soup.select_one('time, .date, .published, [datetime]')
-        if date_elem:
-            published_date = date_elem.get('datetime') or date_elem.get_text().strip()
-
-        # Extract category/tags
-        categories = []
-        category_elems = soup.select('.category, .tag, [rel="category"]')
-        for cat in category_elems:
-            categories.append(cat.get_text().strip())
-
-        # Extract featured image
-        featured_image = ''
-        img_elem = soup.select_one('.featured-image img, article img, .post-image img')
-        if img_elem:
-            featured_image = img_elem.get('src', '')
-            if featured_image and not featured_image.startswith('http'):
-                featured_image = 'https:' + featured_image if featured_image.startswith('//') else 'https://www.partselect.com' + featured_image
-
-        # Extract all images in article
-        images = []
-        img_elems = soup.select('article img, .content img, .post-content img')
-        for img in img_elems[:10]:  # Limit to 10 images
-            img_src = img.get('src', '')
-            if img_src:
-                if not img_src.startswith('http'):
-                    img_src = 'https:' + img_src if img_src.startswith('//') else 'https://www.partselect.com' + img_src
-                images.append(img_src)
-
-        # Extract full article content
-        content = ''
-        content_elem = soup.select_one('article, .article-content, .post-content, .content, main')
-        if content_elem:
-            # Get all paragraphs
-            paragraphs = content_elem.select('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-
-        # Extract reading time if available
-        reading_time = ''
-        time_elem = soup.select_one('.reading-time, [class*="read-time"]')
-        if time_elem:
-            reading_time = time_elem.get_text().strip()
-
-        # Extract related parts mentioned in article
-        related_parts = []
-        part_links = soup.select('a[href*="/PS"]')
-        for link in part_links[:5]:  # Limit to 5 parts
-            part_text = link.get_text().strip()
-            part_url = link.get('href', '')
-            if part_text and 'PS' in part_url:
-                related_parts.append({
-                    'part_name': part_text,
-                    'part_url': part_url if part_url.startswith('http') else 'https://www.partselect.com' + part_url
-                })
-
-        # Extract video embeds
-        videos = []
-        yt_iframes = soup.select('iframe[src*="youtube"], iframe[src*="youtu.be"]')
-        for iframe in yt_iframes[:3]:
-            video_url = iframe.get('src', '')
-            if video_url:
-                videos.append(video_url)
-
-        # Extract meta description
-        meta_desc = ''
-        meta_elem = soup.select_one('meta[name="description"]')
-        if meta_elem:
-            meta_desc = meta_elem.get('content', '')
-
-        # Build blog article data - only actual website metadata
-        article_data = {
-            'appliance_type': blog_info['appliance_type'],
-            'title': title,
-            'url': url,
-            'author': author,
-            'published_date': published_date,
-            'reading_time': reading_time,
-            'categories': ' | '.join(categories) if categories else '',
-            'meta_description': meta_desc,
-            'excerpt': blog_info['excerpt'],
-            'content': content,
-            'content_length': len(content),
-            'featured_image': featured_image,
-            'images': ' | '.join(images) if images else '',
-            'image_count': len(images),
-            'related_parts': json.dumps(related_parts) if related_parts else '',
-            'related_parts_count': len(related_parts),
-            'video_urls': ' | '.join(videos) if videos else '',
-            'video_count': len(videos),
-            'topic_source': blog_info['topic_url'],
-            'scraped_at': pd.Timestamp.now().isoformat()
-        }
-
-        driver.quit()
-        return article_data
+        async with semaphore:
+            tree = await fetch_page_tree(client, browser_pool, url)
+        return parse_blog_article(tree, blog_info)
 
     except Exception as e:
         print(f"   ⚠️  Error scraping {url}: {e}")
-        driver.quit()
         return None
 
+async def scrape_blog_articles(blogs):
+    """Scrape all blog articles concurrently, keeping the input order."""
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+
+    with ThreadPoolExecutor(max_workers=BROWSER_WORKERS) as browser_pool:
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=REQUEST_HEADERS,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=MAX_CONNECTIONS),
+            follow_redirects=True
+        ) as client:
+            results = await async_tqdm.gather(
+                *(scrape_blog_article(client, semaphore, browser_pool, blog_info) for blog_info in blogs),
+                desc="Scraping blogs"
+            )
+
+    return [result for result in results if result]
+
+def parse_blog_article(tree, blog_info):
+    """
+    Extract full blog article content with metadata from website only.
+    Extracts: title, author, date, content, tags, images, etc.
+    """
+    url = blog_info['url']
+
+    # Extract title
+    title = blog_info['title']
+    title_elem = select_one(tree, SEL_TITLE)
+    if title_elem is not None:
+        title = title_elem.text_content().strip()
+
+    # Extract author
+    author = ''
+    author_elem = select_one(tree, SEL_AUTHOR)
+    if author_elem is not None:
+        author = author_elem.text_content().strip()
+
+    # Extract published date
+    published_date = ''
+    date_elem = select_one(tree, SEL_DATE)
+    if date_elem is not None:
+        published_date = date_elem.get('datetime') or date_elem.text_content().strip()
+
+    # Extract category/tags
+    categories = []
+    category_elems = SEL_CATEGORIES(tree)
+    for cat in category_elems:
+        categories.append(cat.text_content().strip())
+
+    # Extract featured image
+    featured_image = ''
+    img_elem = select_one(tree, SEL_FEATURED_IMAGE)
+    if img_elem is not None:
+        featured_image = img_elem.get('src', '')
+        if featured_image and not featured_image.startswith('http'):
+            featured_image = 'https:' + featured_image if featured_image.startswith('//') else 'https://www.partselect.com' + featured_image
+
+    # Extract all images in article
+    images = []
+    img_elems = SEL_IMAGES(tree)
+    for img in img_elems[:10]:  # Limit to 10 images
+        img_src = img.get('src', '')
+        if img_src:
+            if not img_src.startswith('http'):
+                img_src = 'https:' + img_src if img_src.startswith('//') else 'https://www.partselect.com' + img_src
+            images.append(img_src)
+
+    # Extract full article content
+    content = ''
+    content_elem = select_one(tree, SEL_CONTENT)
+    if content_elem is not None:
+        # Get all paragraphs
+        # Serialize each paragraph's text once (not once for the test and again for the join)
+        paragraph_texts = (p.text_content().strip() for p in SEL_PARAGRAPHS(content_elem))
+        content = '\n\n'.join(text for text in paragraph_texts if text)
+
+    # Extract reading time if available
+    reading_time = ''
+    time_elem = select_one(tree, SEL_READING_TIME)
+    if time_elem is not None:
+        reading_time = time_elem.text_content().strip()
+
+    # Extract related parts mentioned in article
+    related_parts = []
+    part_links = SEL_PART_LINKS(tree)
+    for link in part_links[:5]:  # Limit to 5 parts
+        part_text = link.text_content().strip()
+        part_url = link.get('href', '')
+        if part_text and 'PS' in part_url:
+            related_parts.append({
+                'part_name': part_text,
+                'part_url': part_url if part_url.startswith('http') else 'https://www.partselect.com' + part_url
+            })
+
+    # Extract video embeds
+    videos = []
+    yt_iframes = SEL_VIDEOS(tree)
+    for iframe in yt_iframes[:3]:
+        video_url = iframe.get('src', '')
+        if video_url:
+            videos.append(video_url)
+
+    # Extract meta description
+    meta_desc = ''
+    meta_elem = select_one(tree, SEL_META_DESCRIPTION)
+    if meta_elem is not None:
+        meta_desc = meta_elem.get('content', '')
+
+    # Build blog article data - only actual website metadata
+    article_data = {
+        'appliance_type': blog_info['appliance_type'],
+        'title': title,
+        'url': url,
+        'author': author,
+        'published_date': published_date,
+        'reading_time': reading_time,
+        'categories': ' | '.join(categories) if categories else '',
+        'meta_description': meta_desc,
+        'excerpt': blog_info['excerpt'],
+        'content': content,
+        'content_length': len(content),
+        'featured_image': featured_image,
+        'images': ' | '.join(images) if images else '',
+        'image_count': len(images),
+        'related_parts': json.dumps(related_parts) if related_parts else '',
+        'related_parts_count': len(related_parts),
+        'video_urls': ' | '.join(videos) if videos else '',
+        'video_count': len(videos),
+        'topic_source': blog_info['topic_url'],
+        'scraped_at': datetime.now().isoformat()
+    }
+
+    return article_data
+
 # Step 1: Get all blog article URLs from all topics
-all_blog_urls = []
-for topic_url in BLOG_TOPICS:
-    urls = scrape_blog_topic_urls(topic_url)
-    all_blog_urls.extend(urls)
-
-# Remove duplicates
-seen_urls = set()
-unique_blog_urls = []
+# Topic pages are independent, so load them in parallel, one Chrome per worker.
+# map() keeps BLOG_TOPICS order, so deduplication below still favours the first topic.
+with ThreadPoolExecutor(max_workers=min(TOPIC_WORKERS, len(BLOG_TOPICS))) as executor:
+    all_blog_urls = [blog for urls in executor.map(scrape_blog_topic_urls, BLOG_TOPICS) for blog in urls]
+# The topic workers are gone; close their browsers before the article fetches
+quit_drivers()
+
+# Remove duplicates (one dict keyed by URL; the first topic listing an article wins)
+unique_blogs = {}
 for blog in all_blog_urls:
-    if blog['url'] not in seen_urls:
-        seen_urls.add(blog['url'])
-        unique_blog_urls.append(blog)
+    unique_blogs.setdefault(blog['url'], blog)
+unique_blog_urls = list(unique_blogs.values())
 
 print(f"\n📊 Total blog articles to scrape: {len(unique_blog_urls)}")
 print(f"   - Refrigerator blogs: {len([b for b in unique_blog_urls if b['appliance_type'] == 'refrigerator'])}")
 print(f"   - Dishwasher blogs: {len([b for b in unique_blog_urls if b['appliance_type'] == 'dishwasher'])}")
 
-# Step 2: Scrape each blog article in parallel
-print(f"\n⚡ Scraping blog article details with Selenium + BeautifulSoup...")
-blog_articles = []
-
-with ThreadPoolExecutor(max_workers=3) as executor:
-    futures = {
-        executor.submit(scrape_blog_article, blog_info): blog_info
-        for blog_info in unique_blog_urls
-    }
-
-    for future in tqdm(as_completed(futures), total=len(futures), desc="Scraping blogs"):
-        result = future.result()
-        if result:
-            blog_articles.append(result)
+# Step 2: Scrape each blog article concurrently
+print(f"\n⚡ Scraping blog article details with httpx + lxml...")
+blog_articles = asyncio.run(scrape_blog_articles(unique_blog_urls))
 
 # Step 3: Save to JSON - only 2 files for blogs
 print(f"\n💾 Saving {len(blog_articles)} blog articles...")
@@ -332,11 +483,11 @@ output_dir.mkdir(parents=True, exist_ok=True)
 refrigerator_blogs = [b for b in blog_articles if b['appliance_type'] == 'refrigerator']
 dishwasher_blogs = [b for b in blog_articles if b['appliance_type'] == 'dishwasher']
 
-with open(output_dir / 'refrigerator_blogs.json', 'w', encoding='utf-8') as f:
-    json.dump(refrigerator_blogs, f, indent=2, ensure_ascii=False)
+with open(output_dir / 'refrigerator_blogs.json', 'wb') as f:
+    f.write(orjson.dumps(refrigerator_blogs, option=orjson.OPT_INDENT_2))
 
-with open(output_dir / 'dishwasher_blogs.json', 'w', encoding='utf-8') as f:
-    json.dump(dishwasher_blogs, f, indent=2, ensure_ascii=False)
+with open(output_dir / 'dishwasher_blogs.json', 'wb') as f:
+    f.write(orjson.dumps(dishwasher_blogs, option=orjson.OPT_INDENT_2))
 
 print(f"\n{'='*60}")
 print(f"✅ BLOG ARTICLES SCRAPING COMPLETE!")
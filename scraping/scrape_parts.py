@@ -8,7 +8,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import pandas as pd
+import csv
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -141,23 +141,25 @@ for appliance_type, url in CATEGORIES.items():
     all_parts.extend(parts)
     print(f"   ✅ Scraped {len(parts)} {appliance_type} parts from listing")
 
-# Create DataFrame
-df = pd.DataFrame(all_parts)
+# Remove duplicates by part_number (first occurrence wins)
+seen = set()
+unique_parts = [p for p in all_parts if not (p['part_number'] in seen or seen.add(p['part_number']))]
 
-# Remove duplicates by part_number
-df = df.drop_duplicates(subset=['part_number'], keep='first')
-
-# Save to CSV
+# Save to CSV - rows are already flat dicts, so write them directly
 output_path = 'data/processed/parts_latest.csv'
 Path('data/processed').mkdir(parents=True, exist_ok=True)
-df.to_csv(output_path, index=False)
+with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    if unique_parts:
+        writer = csv.DictWriter(f, fieldnames=unique_parts[0].keys())
+        writer.writeheader()
+        writer.writerows(unique_parts)
 
 print(f"\n{'='*60}")
 print(f"✅ INITIAL SCRAPING COMPLETE!")
 print(f"{'='*60}")
-print(f"   Total parts scraped: {len(df)}")
-print(f"   Refrigerator parts: {len(df[df['appliance_type'] == 'refrigerator'])}")
-print(f"   Dishwasher parts: {len(df[df['appliance_type'] == 'dishwasher'])}")
+print(f"   Total parts scraped: {len(unique_parts)}")
+print(f"   Refrigerator parts: {sum(p['appliance_type'] == 'refrigerator' for p in unique_parts)}")
+print(f"   Dishwasher parts: {sum(p['appliance_type'] == 'dishwasher' for p in unique_parts)}")
 print(f"   Saved to: {output_path}")
 print(f"\n   ⚠️  Fields extracted: part_name, part_number, image_url, product_url")
 print(f"   ⏭️  Next step: Run enrich_parts.py to add ALL detailed fields")
@@ -8,14 +8,19 @@ Sources:
 - https://www.partselect.com/Fast-Shipping.htm
 """
 
+import lxml.html
+from lxml.cssselect import CSSSelector
+import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
+import atexit
+import threading
 import time
-import json
+import orjson
 from pathlib import Path
 from datetime import datetime
 
@@ -36,66 +41,150 @@ POLICY_PAGES = [
     }
 ]
 
+# Policy pages are static HTML: fetch them over one keep-alive session and
+# only start Chrome when a page comes back with almost no text
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT = 10
+MIN_PAGE_TEXT_CHARS = 500
+
+SESSION = requests.Session()
+SESSION.headers.update(REQUEST_HEADERS)
+SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+# Page selectors, compiled to XPath once instead of on every page
+SEL_TITLE = CSSSelector('h1', translator='html')
+SEL_META_DESCRIPTION = CSSSelector('meta[name="description"]', translator='html')
+SEL_HEADINGS = CSSSelector('h2', translator='html')
+SEL_PARAGRAPHS = CSSSelector('p', translator='html')
+SEL_ORDERED_ITEMS = CSSSelector('ol li', translator='html')
+SEL_UNORDERED_ITEMS = CSSSelector('ul li', translator='html')
+SEL_MAIN_CONTENT = CSSSelector('main, article, .content, #main-content', translator='html')
+
+# Chrome is slow to start, so each thread keeps one driver for the whole run
+_thread_local = threading.local()
+_drivers = []
+_drivers_lock = threading.Lock()
+
+
+# Built once at import and shared by every driver this module creates
+CHROME_OPTIONS = Options()
+for arg in (
+    '--disable-blink-features=AutomationControlled',
+    '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+):
+    CHROME_OPTIONS.add_argument(arg)
+
 
 def create_driver():
-    chrome_options = Options()
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--no-sandbox')
-    return webdriver.Chrome(options=chrome_options)
+    return webdriver.Chrome(options=CHROME_OPTIONS)
+
+
+def get_thread_driver():
+    """Return this thread's WebDriver, creating it on first use."""
+    driver = getattr(_thread_local, 'driver', None)
+    if driver is None:
+        driver = create_driver()
+        _thread_local.driver = driver
+        with _drivers_lock:
+            _drivers.append(driver)
+    return driver
+
+
+@atexit.register
+def quit_drivers():
+    """Quit every WebDriver created by the worker threads."""
+    with _drivers_lock:
+        for driver in _drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        _drivers.clear()
+
+
+def fetch_tree_with_browser(url):
+    """Load a JS-rendered page in this thread's Chrome and parse the result with lxml."""
+    driver = get_thread_driver()
+    driver.get(url)
+    WebDriverWait(driver, 10).until(
+        EC.presence_of_element_located((By.TAG_NAME, "body"))
+    )
+    time.sleep(3)
+    return lxml.html.fromstring(driver.page_source)
+
+
+def fetch_page_tree(url):
+    """
+    Fetch a page over HTTP and parse it with lxml.
+    Falls back to Selenium when the request fails (e.g. a blocked or erroring
+    response) or the HTML has too little text (JS-rendered).
+    """
+    try:
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException:
+        return fetch_tree_with_browser(url)
+
+    tree = lxml.html.fromstring(response.content)
+    if len(tree.text_content().strip()) >= MIN_PAGE_TEXT_CHARS:
+        return tree
+
+    return fetch_tree_with_browser(url)
+
+
+def element_text_lines(element):
+    """Stripped, non-empty text nodes of an element, skipping script and style."""
+    texts = element.xpath('.//text()[not(ancestor::script) and not(ancestor::style)]')
+    return [text.strip() for text in texts if text.strip()]
 
 
 def scrape_policy_page(policy_info):
     """Scrape policy page - extract only what actually exists."""
-    driver = create_driver()
     url = policy_info['url']
 
     try:
         print(f"  Scraping: {url}")
 
-        driver.get(url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(3)
-
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        tree = fetch_page_tree(url)
 
         # Extract title (h1)
-        title_elem = soup.select_one('h1')
-        title = title_elem.get_text().strip() if title_elem else ''
+        title_elems = SEL_TITLE(tree)
+        title = title_elems[0].text_content().strip() if title_elems else ''
 
         # Extract meta description
-        meta_desc_elem = soup.select_one('meta[name="description"]')
-        meta_description = meta_desc_elem.get('content', '') if meta_desc_elem else ''
+        meta_desc_elems = SEL_META_DESCRIPTION(tree)
+        meta_description = meta_desc_elems[0].get('content', '') if meta_desc_elems else ''
 
         # Extract all h2 headings (sections)
-        h2_headings = soup.select('h2')
-        section_headings = [h2.get_text().strip() for h2 in h2_headings]
+        h2_headings = SEL_HEADINGS(tree)
+        section_headings = [h2.text_content().strip() for h2 in h2_headings]
 
         # Extract all paragraphs
-        paragraphs = soup.select('p')
-        all_paragraphs = [p.get_text().strip() for p in paragraphs if p.get_text().strip()]
+        paragraphs = SEL_PARAGRAPHS(tree)
+        all_paragraphs = [p.text_content().strip() for p in paragraphs if p.text_content().strip()]
 
         # Extract ordered list items (steps/process)
-        ol_items = soup.select('ol li')
-        ordered_list_items = [li.get_text().strip() for li in ol_items if li.get_text().strip()]
+        ol_items = SEL_ORDERED_ITEMS(tree)
+        ordered_list_items = [li.text_content().strip() for li in ol_items if li.text_content().strip()]
 
         # Extract unordered list items
-        ul_items = soup.select('ul li')
+        ul_items = SEL_UNORDERED_ITEMS(tree)
         # Filter out navigation items (likely have links or are very short)
         unordered_list_items = [
-            li.get_text().strip()
+            li.text_content().strip()
             for li in ul_items
-            if li.get_text().strip() and len(li.get_text().strip()) > 20
+            if li.text_content().strip() and len(li.text_content().strip()) > 20
         ][:20]  # Limit to reasonable number
 
         # Get full content text
         # Try to find main content area, otherwise use body
-        main_content = soup.select_one('main, article, .content, #main-content')
+        main_content = SEL_MAIN_CONTENT(tree)
         if main_content:
-            full_content = main_content.get_text(separator='\n', strip=True)
+            full_content = '\n'.join(element_text_lines(main_content[0]))
         else:
             # Fallback: get all paragraphs joined
             full_content = '\n\n'.join(all_paragraphs)
@@ -117,12 +206,10 @@ def scrape_policy_page(policy_info):
 
         print(f"    ✓ Extracted: {len(all_paragraphs)} paragraphs, {len(ordered_list_items)} ordered items")
 
-        driver.quit()
         return policy_data
 
     except Exception as e:
         print(f"    ❌ Error: {e}")
-        driver.quit()
         return None
 
 
@@ -141,8 +228,8 @@ print(f"\n💾 Saving {len(policy_documents)} policy documents...")
 Path('data/processed').mkdir(parents=True, exist_ok=True)
 
 output_file = 'data/processed/policies.json'
-with open(output_file, 'w', encoding='utf-8') as f:
-    json.dump(policy_documents, f, indent=2, ensure_ascii=False)
+with open(output_file, 'wb') as f:
+    f.write(orjson.dumps(policy_documents, option=orjson.OPT_INDENT_2))
 
 print(f"\n{'='*60}")
 print(f"✅ POLICY SCRAPING COMPLETE!")
@@ -17,19 +17,22 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
-import time
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from tqdm import tqdm
-
-print("🔧 Scraping repair part sections for refrigerators and dishwashers...\n")
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
+import io
+import os
+import lxml.html
+from lxml import etree
+from lxml.etree import XPath
+import asyncio
+from collections import Counter
+from contextlib import ExitStack
+import httpx
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from tqdm.asyncio import tqdm as async_tqdm
+
+from process_rag_documents import atomic_output, write_json_array
 
 # Configuration
 REPAIR_CATEGORIES = {
@@ -37,48 +40,277 @@ REPAIR_CATEGORIES = {
     'dishwasher': 'https://www.partselect.com/Repair/Dishwasher/'
 }
 
-def create_driver():
-    """Create Selenium WebDriver with anti-detection."""
-    chrome_options = Options()
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--no-sandbox')
-    # chrome_options.add_argument('--headless')  # Uncomment for headless mode
+# Repair pages are server-rendered: fetch them over one keep-alive HTTP/2
+# client and only start Chromium for a page missing the markup we parse
+REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+REQUEST_TIMEOUT = 10
+MAX_CONNECTIONS = 32
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_IN_FLIGHT = 16
+USE_BROWSER = True  # Fall back to Playwright when the HTTP response lacks the expected markup
+MAX_CONCURRENT_PAGES = 8  # Pages open at once in the shared browser
+PAGE_READY_TIMEOUT = 10000  # ms the browser waits for a page's ready check
+PARSE_WORKERS = os.cpu_count() or 1  # Processes parsing symptom pages off the event loop
+MAX_VIDEOS = 3  # YouTube embeds kept per symptom page
+
+# Category pages are small and parsed whole; symptom pages are streamed (parse_symptom_page)
+XP_REPAIR_LINKS = XPath('//a[contains(@href, "/Repair/")]')
+
+# Visible text, skipping script/style/template contents as BeautifulSoup's get_text() does
+XP_VISIBLE_TEXT = XPath('descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::template)]')
+RAW_TEXT_TAGS = ('script', 'style', 'template')
+
+# <h2 id> headings that are page furniture rather than part sections
+EXCLUDED_SECTION_IDS = frozenset({
+    'ShopByDepartment', 'hTopApplianceBrands', 'hTopLawnEquipmentBrands', 'SampleTags',
+    'hj-survey-lbl-1', 'survey'  # Survey sections
+})
+EXCLUDED_SECTION_KEYWORDS = ('survey', 'rate', 'feedback', 'experience')
+
+# What the browser waits for before handing a page over: the same markup is_ready
+# checks, so page furniture rendered at DOMContentLoaded doesn't count
+REPAIR_LINKS_READY_JS = """() => document.querySelector('a[href*="/Repair/"]') !== null"""
+PART_SECTIONS_READY_JS = f"""() => {{
+    const excludedIds = new Set({orjson.dumps(sorted(EXCLUDED_SECTION_IDS)).decode()});
+    const excludedKeywords = {orjson.dumps(EXCLUDED_SECTION_KEYWORDS).decode()};
+    return Array.from(document.querySelectorAll('h2[id]')).some(heading => {{
+        const text = heading.textContent.toLowerCase();
+        return heading.id !== '' && !excludedIds.has(heading.id) &&
+            !excludedKeywords.some(keyword => text.includes(keyword));
+    }});
+}}"""
+
+# A part's difficulty is the first of these its section mentions, in this order
+DIFFICULTY_MARKERS = ('REALLY EASY', 'EASY', 'MODERATE', 'DIFFICULT', 'REALLY DIFFICULT')
+
+# Page-level fields: first element (in document order) whose tag and class match
+PAGE_FIELDS = {
+    'title': lambda tag, cls: tag == 'h1' or 'page-title' in cls.split(),
+    'difficulty': lambda tag, cls: 'difficulty' in cls,
+    'repair_time': lambda tag, cls: 'repair-time' in cls.split() or 'time-estimate' in cls,
+}
+
+class LazyBrowser:
+    """
+    One shared Playwright Chromium, launched the first time a page needs it.
+    Each page loads in its own lightweight context; a semaphore caps how many are open.
+    """
 
-    return webdriver.Chrome(options=chrome_options)
+    def __init__(self):
+        self._playwright = None
+        self._browser = None
+        self._launch_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+
+    async def _get_browser(self):
+        async with self._launch_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=False,  # Set to True for headless mode
+                    args=['--disable-blink-features=AutomationControlled']
+                )
+        return self._browser
+
+    async def fetch_html(self, url, ready_check=None):
+        """
+        Load a page and return the rendered HTML.
+        With a ready_check (a JavaScript function), wait until it returns true
+        (at most PAGE_READY_TIMEOUT ms); on timeout the page is returned as it stands.
+        """
+        browser = await self._get_browser()
+        async with self._semaphore:
+            context = await browser.new_context(user_agent=REQUEST_HEADERS['User-Agent'])
+            try:
+                page = await context.new_page()
+                # Return at DOMContentLoaded (like Chrome's "eager" load strategy), no blind sleep
+                await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+                if ready_check:
+                    try:
+                        await page.wait_for_function(ready_check, timeout=PAGE_READY_TIMEOUT)
+                    except PlaywrightTimeoutError:
+                        pass
+                return await page.content()
+            finally:
+                await context.close()
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+            await self._playwright.stop()
+
+def element_text(elem):
+    """Text of an element, leaving out any script/style/template it contains."""
+    if elem.tag in RAW_TEXT_TAGS:
+        return elem.text or ''
+    # Usually nothing needs leaving out, so libxml2's text serializer can do the whole walk
+    if next(elem.iter(*RAW_TEXT_TAGS), None) is None and next(elem.iterancestors(*RAW_TEXT_TAGS), None) is None:
+        return etree.tostring(elem, method='text', encoding='unicode', with_tail=False)
+    return ''.join(XP_VISIBLE_TEXT(elem))
+
+def parse_html(html):
+    """Parse a whole page with lxml (a blank response gives an empty document)."""
+    return lxml.html.document_fromstring(html if html.strip() else '<html></html>')
+
+def parse_symptom_page(html):
+    """
+    Parse a symptom page in one streaming pass with lxml's iterparse.
+
+    Collects the page title, difficulty and repair time, the first MAX_VIDEOS YouTube
+    iframes, and every part section: an <h2 id> heading plus the text of each sibling
+    after it, up to the next part section. Each subtree is cleared as soon as nothing still
+    needs its text, so the parsed page is never held in memory as a whole.
 
-def scrape_symptom_urls(appliance_type, base_url):
+    Returns: dict with 'title', 'difficulty', 'repair_time' (None if absent), 'videos'
+             and 'sections' (list of (part_id, part_name, content))
+    """
+    page = {'title': None, 'difficulty': None, 'repair_time': None, 'videos': []}
+    if not html.strip():
+        page['sections'] = []
+        return page
+
+    encoding = None
+    if isinstance(html, str):
+        html, encoding = html.encode('utf-8'), 'utf-8'
+
+    pending_fields = dict(PAGE_FIELDS)  # page fields with no element matched yet
+    fields_of = {}  # element -> page fields it provides, filled in at its end
+    sections = []  # [part_id, part_name, parent, content_parts] in document order
+    collecting = {}  # parent element -> open sections still taking its children's text
+    needs_text = []  # per unfinished element: does its text have to survive until its end?
+    pinned = 0
+
+    for event, elem in etree.iterparse(io.BytesIO(html), events=('start', 'end'), html=True, encoding=encoding):
+        parent = elem.getparent()
+        tag = elem.tag
+
+        if event == 'start':
+            needed = parent in collecting
+            if tag == 'h2' and elem.get('id') is not None:
+                needed = True
+            elif tag == 'iframe':
+                src = elem.get('src', '')
+                if ('youtube' in src or 'youtu.be' in src) and len(page['videos']) < MAX_VIDEOS:
+                    page['videos'].append(src)
+
+            # Once every page field has its element, the class attribute is no longer needed
+            if pending_fields:
+                cls = elem.get('class') or ''
+                matched = [field for field, matches in pending_fields.items() if matches(tag, cls)]
+                if matched:
+                    for field in matched:
+                        del pending_fields[field]
+                    fields_of[elem] = matched
+                    needed = True
+
+            needs_text.append(needed)
+            pinned += needed
+            continue
+
+        text = None
+        is_section = False
+        if tag == 'h2' and elem.get('id') is not None:
+            text = element_text(elem)
+            part_id = elem.get('id')
+            lowered = text.lower()
+            is_section = (
+                bool(part_id) and
+                part_id not in EXCLUDED_SECTION_IDS and
+                not any(keyword in lowered for keyword in EXCLUDED_SECTION_KEYWORDS)
+            )
+            # The previous section stops here if this heading is its sibling
+            if is_section and sections and collecting.get(parent) and collecting[parent][-1] is sections[-1]:
+                collecting[parent].pop()
+
+        # Every open section under this parent takes this sibling's text
+        if collecting.get(parent):
+            if text is None:
+                text = element_text(elem)
+            content = text.strip()
+            if content and len(content) > 10:  # Meaningful content
+                for section in collecting[parent]:
+                    section[3].append(content)
+
+        if is_section:
+            section = [part_id, text.strip(), parent, []]
+            sections.append(section)
+            collecting.setdefault(parent, []).append(section)
+
+        # Sections headed by a child of this element have run out of siblings
+        collecting.pop(elem, None)
+
+        for field in fields_of.pop(elem, ()):
+            page[field] = element_text(elem).strip()
+
+        pinned -= needs_text.pop()
+        if not pinned:
+            elem.clear(keep_tail=True)
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+    page['sections'] = [(part_id, part_name, '\n\n'.join(parts)) for part_id, part_name, _, parts in sections]
+    return page
+
+async def fetch_page(client, browser, url, parse, is_ready, ready_check, parser_pool=None):
+    """
+    Fetch a page over HTTP and parse it with parse(html).
+    Falls back to the browser when the request fails (e.g. bot protection answers
+    403/429/5xx) or is_ready(result) is false (JS-rendered);
+    the browser returns once ready_check passes.
+    With a parser_pool, parsing runs in a worker process (parse and its
+    result must then be picklable).
+    """
+    async def run_parse(html):
+        if parser_pool is None:
+            return parse(html)
+        return await asyncio.get_running_loop().run_in_executor(parser_pool, parse, html)
+
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError:
+        if not USE_BROWSER:
+            raise
+    else:
+        result = await run_parse(response.content)
+        if not USE_BROWSER or is_ready(result):
+            return result
+
+    return await run_parse(await browser.fetch_html(url, ready_check))
+
+async def scrape_symptom_urls(client, semaphore, browser, appliance_type, base_url):
     """
     Scrape all symptom URLs from the main repair category page.
     Example: Get all symptom links from /Repair/Refrigerator/
     """
     print(f"\n📋 Scraping symptom URLs for {appliance_type}...")
-    driver = create_driver()
     symptom_urls = []
 
     try:
-        driver.get(base_url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(2)
-
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        async with semaphore:
+            tree = await fetch_page(client, browser, base_url, parse_html, XP_REPAIR_LINKS, REPAIR_LINKS_READY_JS)
 
         # Find all symptom/repair links
-        symptom_links = soup.select('a[href*="/Repair/"]')
+        symptom_links = XP_REPAIR_LINKS(tree)
+        prefix = f'/Repair/{appliance_type.capitalize()}/'
+        seen_urls = set()
 
         for link in symptom_links:
             href = link.get('href', '')
-            if href and f'/Repair/{appliance_type.capitalize()}/' in href and href not in [s['url'] for s in symptom_urls]:
+            if href and prefix in href:
                 # Build full URL
                 full_url = href if href.startswith('http') else 'https://www.partselect.com' + href
+                if full_url in seen_urls:
+                    continue
 
                 # Get symptom title
-                symptom_title = link.get_text().strip()
+                symptom_title = element_text(link).strip()
 
                 if symptom_title and full_url != base_url:  # Avoid duplicates
+                    seen_urls.add(full_url)
                     symptom_urls.append({
                         'url': full_url,
                         'symptom': symptom_title,
@@ -89,104 +321,46 @@ def scrape_symptom_urls(appliance_type, base_url):
 
     except Exception as e:
         print(f"   ❌ Error scraping symptom URLs: {e}")
-    finally:
-        driver.quit()
 
     return symptom_urls
 
-def extract_section_content(section_elem, next_section_elem):
-    """
-    Extract all content between current section and next section.
-    Returns the text content specific to this part section only.
-    """
-    content_parts = []
-
-    # Get all siblings between current section and next section
-    current = section_elem.find_next_sibling()
-
-    while current and current != next_section_elem:
-        # Extract text from this element
-        text = current.get_text().strip()
-        if text and len(text) > 10:  # Meaningful content
-            content_parts.append(text)
-        current = current.find_next_sibling()
-
-    return '\n\n'.join(content_parts)
-
-def scrape_part_sections(symptom_info):
+async def scrape_part_sections(client, semaphore, browser, parser_pool, symptom_info):
     """
     Scrape individual part sections from a symptom page.
     Each part section (marked by <h2 id="PartName">) becomes a separate document.
+    Returns: (symptom_info, part documents), with None for the documents if the page failed
     """
-    driver = create_driver()
     url = symptom_info['url']
     part_documents = []
 
     try:
-        driver.get(url)
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
-        time.sleep(2)
-
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        async with semaphore:
+            page = await fetch_page(
+                client, browser, url, parse_symptom_page, lambda page: bool(page['sections']), PART_SECTIONS_READY_JS, parser_pool
+            )
 
         # Extract page-level metadata
         symptom = symptom_info['symptom']
-        title_elem = soup.select_one('h1, .page-title')
-        if title_elem:
-            symptom = title_elem.get_text().strip()
-
-        # Extract page-level difficulty (if exists)
-        page_difficulty = ''
-        difficulty_elem = soup.select_one('.difficulty, [class*="difficulty"]')
-        if difficulty_elem:
-            page_difficulty = difficulty_elem.get_text().strip()
-
-        # Extract repair time
-        repair_time = ''
-        time_elem = soup.select_one('.repair-time, [class*="time-estimate"]')
-        if time_elem:
-            repair_time = time_elem.get_text().strip()
+        if page['title'] is not None:
+            symptom = page['title']
 
-        # Extract videos (page-level)
-        videos = []
-        yt_iframes = soup.select('iframe[src*="youtube"], iframe[src*="youtu.be"]')
-        for iframe in yt_iframes[:3]:
-            video_url = iframe.get('src', '')
-            if video_url:
-                videos.append(video_url)
-
-        # Find all part sections (h2 elements with IDs)
-        part_sections = soup.select('h2[id]')
-
-        # Filter out generic/non-part IDs
-        excluded_ids = [
-            'ShopByDepartment', 'hTopApplianceBrands', 'hTopLawnEquipmentBrands', 'SampleTags',
-            'hj-survey-lbl-1', 'survey'  # Survey sections
-        ]
-        excluded_keywords = ['survey', 'rate', 'feedback', 'experience']
-
-        part_sections = [
-            section for section in part_sections
-            if section.get('id') and
-            section.get('id') not in excluded_ids and
-            not any(keyword in section.get_text().lower() for keyword in excluded_keywords)
-        ]
+        # Page-level difficulty and repair time (if they exist)
+        page_difficulty = page['difficulty'] or ''
+        repair_time = page['repair_time'] or ''
 
-        print(f"   Found {len(part_sections)} part sections in {symptom}")
+        # Extract videos (page-level)
+        videos = page['videos']
 
-        # Extract content for each part section
-        for idx, section in enumerate(part_sections):
-            part_id = section.get('id', '')
-            part_name = section.get_text().strip()
+        # Part sections (h2 elements with IDs, minus page furniture)
+        part_sections = page['sections']
 
-            # Get next section to know where this section ends
-            next_section = part_sections[idx + 1] if idx + 1 < len(part_sections) else None
+        print(f"   Found {len(part_sections)} part sections in {symptom}")
 
-            # Extract content specific to this part section
-            part_content = extract_section_content(section, next_section)
+        # One timestamp per page, shared by all of its part documents
+        scraped_at = datetime.now()  # orjson writes it in ISO 8601
 
+        # Create a document for each part section
+        for part_id, part_name, part_content in part_sections:
             # Skip sections with insufficient content
             if len(part_content) < 200:
                 continue
@@ -196,9 +370,9 @@ def scrape_part_sections(symptom_info):
 
             # Look for difficulty within this part section
             if part_content:
-                difficulty_markers = ['REALLY EASY', 'EASY', 'MODERATE', 'DIFFICULT', 'REALLY DIFFICULT']
-                for marker in difficulty_markers:
-                    if marker in part_content.upper():
+                upper_content = part_content.upper()
+                for marker in DIFFICULTY_MARKERS:
+                    if marker in upper_content:
                         part_difficulty = marker
                         break
 
@@ -219,77 +393,166 @@ def scrape_part_sections(symptom_info):
                 'video_count': len(videos),
                 'symptom_url': url,
                 'part_url': f"{url}#{part_id}",  # Direct link to this section
-                'scraped_at': pd.Timestamp.now().isoformat()
+                'scraped_at': scraped_at
             }
 
             part_documents.append(part_doc)
 
-        driver.quit()
-        return part_documents
+        return symptom_info, part_documents
 
     except Exception as e:
         print(f"   ⚠️  Error scraping {url}: {e}")
-        driver.quit()
-        return []
-
-# Step 1: Get all symptom URLs
-all_symptom_urls = []
-for appliance_type, base_url in REPAIR_CATEGORIES.items():
-    urls = scrape_symptom_urls(appliance_type, base_url)
-    all_symptom_urls.extend(urls)
-
-print(f"\n📊 Total symptom pages to scrape: {len(all_symptom_urls)}")
-print(f"   - Refrigerator: {len([u for u in all_symptom_urls if u['appliance_type'] == 'refrigerator'])}")
-print(f"   - Dishwasher: {len([u for u in all_symptom_urls if u['appliance_type'] == 'dishwasher'])}")
-
-# Step 2: Scrape each symptom page and extract part sections
-print(f"\n⚡ Scraping part sections from each symptom page...")
-all_part_documents = []
-
-with ThreadPoolExecutor(max_workers=3) as executor:
-    futures = {
-        executor.submit(scrape_part_sections, symptom_info): symptom_info
-        for symptom_info in all_symptom_urls
-    }
-
-    for future in tqdm(as_completed(futures), total=len(futures), desc="Scraping parts"):
-        part_docs = future.result()
-        if part_docs:
-            all_part_documents.extend(part_docs)
-
-print(f"\n   ✓ Extracted {len(all_part_documents)} part documents")
-
-# Step 3: Separate by appliance type and save
-print(f"\n💾 Saving part documents...")
-
-output_dir = Path('data/rag_documents')
-output_dir.mkdir(parents=True, exist_ok=True)
-
-refrigerator_parts = [p for p in all_part_documents if p['appliance_type'] == 'refrigerator']
-dishwasher_parts = [p for p in all_part_documents if p['appliance_type'] == 'dishwasher']
-
-with open(output_dir / 'refrigerator_parts.json', 'w', encoding='utf-8') as f:
-    json.dump(refrigerator_parts, f, indent=2, ensure_ascii=False)
-
-with open(output_dir / 'dishwasher_parts.json', 'w', encoding='utf-8') as f:
-    json.dump(dishwasher_parts, f, indent=2, ensure_ascii=False)
-
-print(f"\n{'='*60}")
-print(f"✅ REPAIR PART SECTIONS SCRAPING COMPLETE!")
-print(f"{'='*60}")
-print(f"   Total parts scraped: {len(all_part_documents)}")
-print(f"   - Refrigerator parts: {len(refrigerator_parts)}")
-print(f"   - Dishwasher parts: {len(dishwasher_parts)}")
-print(f"\n   Saved to: data/rag_documents/")
-print(f"   - {output_dir / 'refrigerator_parts.json'}")
-print(f"   - {output_dir / 'dishwasher_parts.json'}")
-print(f"\n   Each part document contains:")
-print(f"   ✓ Part name & anchor ID")
-print(f"   ✓ Appliance type & category")
-print(f"   ✓ Title (symptom description)")
-print(f"   ✓ Difficulty (part-specific)")
-print(f"   ✓ Content (ONLY for this part section)")
-print(f"   ✓ Video URLs")
-print(f"   ✓ Direct part URL (with #anchor)")
-print(f"\n   🎯 Ready for vector DB!")
-print(f"{'='*60}")
+        return symptom_info, None
+
+def index_scraped_pages(ndjson_path):
+    """
+    Index the symptom pages already saved in an NDJSON file (one line per page).
+    A last line cut off mid-write by an interrupted run is truncated away,
+    so that page is scraped again and appending continues on a clean line.
+    Returns: dict of symptom_url -> (offset, length, document count) of its line
+    """
+    pages = {}
+    if not ndjson_path.exists():
+        return pages
+
+    with open(ndjson_path, 'r+b') as f:
+        offset = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            page = orjson.loads(line)
+            pages[page['symptom_url']] = (offset, len(line), len(page['documents']))
+            offset += len(line)
+        f.truncate(offset)
+
+    return pages
+
+def iter_saved_documents(ndjson_path, symptom_urls):
+    """
+    Yield the part documents saved in an NDJSON file, pages in symptom_urls order
+    (pages no longer listed follow in file order), whatever order they finished in.
+    """
+    pages = index_scraped_pages(ndjson_path)
+    order = {url: position for position, url in enumerate(symptom_urls)}
+
+    with open(ndjson_path, 'rb') as f:
+        for url, (offset, length, _) in sorted(pages.items(), key=lambda item: order.get(item[0], len(order))):
+            f.seek(offset)
+            yield from orjson.loads(f.read(length))['documents']
+
+async def scrape_repairs(outputs, scraped):
+    """
+    Scrape every symptom page over HTTP (browser only as fallback).
+    Pages in scraped[appliance_type] (saved by an earlier, interrupted run) are skipped.
+    Each finished page is appended to outputs[appliance_type] (a binary file) as one
+    NDJSON line, so documents are never all held in memory and survive a crash.
+    Returns: symptom URLs per appliance type, in category page order
+    """
+    semaphore = asyncio.Semaphore(MAX_IN_FLIGHT)
+    browser = LazyBrowser()
+
+    try:
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=REQUEST_HEADERS,
+            timeout=REQUEST_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            ),
+            follow_redirects=True
+        ) as client:
+            # Step 1: Get all symptom URLs
+            all_symptom_urls = []
+            for urls in await asyncio.gather(*(
+                scrape_symptom_urls(client, semaphore, browser, appliance_type, base_url)
+                for appliance_type, base_url in REPAIR_CATEGORIES.items()
+            )):
+                all_symptom_urls.extend(urls)
+
+            print(f"\n📊 Total symptom pages to scrape: {len(all_symptom_urls)}")
+            type_counts = Counter(u['appliance_type'] for u in all_symptom_urls)
+            print(f"   - Refrigerator: {type_counts['refrigerator']}")
+            print(f"   - Dishwasher: {type_counts['dishwasher']}")
+
+            pending = [u for u in all_symptom_urls if u['url'] not in scraped[u['appliance_type']]]
+            if len(pending) < len(all_symptom_urls):
+                print(f"   (resuming: {len(all_symptom_urls) - len(pending)} already saved)")
+
+            # Step 2: Scrape each symptom page and extract part sections
+            print(f"\n⚡ Scraping part sections from each symptom page...")
+
+            # Page parsing is CPU-bound, so it runs in worker processes while requests continue
+            with ProcessPoolExecutor(max_workers=PARSE_WORKERS) as parser_pool:
+                for next_page in async_tqdm.as_completed(
+                    [
+                        scrape_part_sections(client, semaphore, browser, parser_pool, symptom_info)
+                        for symptom_info in pending
+                    ],
+                    desc="Scraping parts"
+                ):
+                    symptom_info, part_documents = await next_page
+                    # Failed pages aren't saved, so a rerun tries them again
+                    if part_documents is not None:
+                        output = outputs[symptom_info['appliance_type']]
+                        output.write(orjson.dumps({'symptom_url': symptom_info['url'], 'documents': part_documents}) + b'\n')
+                        output.flush()
+
+            symptom_urls = {appliance_type: [] for appliance_type in REPAIR_CATEGORIES}
+            for symptom_info in all_symptom_urls:
+                symptom_urls[symptom_info['appliance_type']].append(symptom_info['url'])
+            return symptom_urls
+
+    finally:
+        await browser.close()
+
+def main():
+    """Scrape repair part sections and save them per appliance type."""
+    print("🔧 Scraping repair part sections for refrigerators and dishwashers...\n")
+
+    output_dir = Path('data/rag_documents')
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Pages stream to one NDJSON file per appliance type as they finish; if the run
+    # dies, the next one keeps what was saved and only scrapes the remaining pages
+    ndjson_paths = {appliance_type: output_dir / f'{appliance_type}_parts.ndjson' for appliance_type in REPAIR_CATEGORIES}
+    scraped = {appliance_type: index_scraped_pages(path) for appliance_type, path in ndjson_paths.items()}
+    with ExitStack() as stack:
+        outputs = {appliance_type: stack.enter_context(open(path, 'ab')) for appliance_type, path in ndjson_paths.items()}
+        symptom_urls = asyncio.run(scrape_repairs(outputs, scraped))
+
+    # Step 3: Convert to the JSON arrays process_rag_documents.py reads, one page at a time
+    # and in symptom order, so reruns produce the same files
+    print(f"\n💾 Saving part documents...")
+
+    doc_counts = Counter()
+    for appliance_type, ndjson_path in ndjson_paths.items():
+        with atomic_output(output_dir / f'{appliance_type}_parts.json') as f_out:
+            doc_counts[appliance_type] = write_json_array(iter_saved_documents(ndjson_path, symptom_urls[appliance_type]), f_out)
+        ndjson_path.unlink()
+
+    print(f"\n   ✓ Extracted {sum(doc_counts.values())} part documents")
+
+    print(f"\n{'='*60}")
+    print(f"✅ REPAIR PART SECTIONS SCRAPING COMPLETE!")
+    print(f"{'='*60}")
+    print(f"   Total parts scraped: {sum(doc_counts.values())}")
+    print(f"   - Refrigerator parts: {doc_counts['refrigerator']}")
+    print(f"   - Dishwasher parts: {doc_counts['dishwasher']}")
+    print(f"\n   Saved to: data/rag_documents/")
+    print(f"   - {output_dir / 'refrigerator_parts.json'}")
+    print(f"   - {output_dir / 'dishwasher_parts.json'}")
+    print(f"\n   Each part document contains:")
+    print(f"   ✓ Part name & anchor ID")
+    print(f"   ✓ Appliance type & category")
+    print(f"   ✓ Title (symptom description)")
+    print(f"   ✓ Difficulty (part-specific)")
+    print(f"   ✓ Content (ONLY for this part section)")
+    print(f"   ✓ Video URLs")
+    print(f"   ✓ Direct part URL (with #anchor)")
+    print(f"\n   🎯 Ready for vector DB!")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    main()
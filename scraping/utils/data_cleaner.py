@@ -1,9 +1,37 @@
 """Data cleaning and validation utilities."""
 
 import re
+from functools import lru_cache
 from typing import Any, Optional
 from decimal import Decimal, InvalidOperation
 
+# Memoized validators keep at most this many distinct inputs
+URL_CACHE_SIZE = 4096
+APPLIANCE_TYPE_CACHE_SIZE = 256
+
+# Patterns compiled once at import rather than looked up in re's cache per call
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_INT_RE = re.compile(r'(\d+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_MODEL_NUMBER_RE = re.compile(r'[A-Z]{2,}[\w\d-]+')
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
+    r'localhost|'  # localhost
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or IP
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+
+def _strip_price_text(text: str) -> str:
+    """
+    Drop '$', ',' and all whitespace, as the old [$,\\s] regex substitution did.
+
+    str.split() breaks on exactly the characters the regex class matches, and
+    replace/split/join is quicker than both the regex and str.translate here.
+    """
+    return ''.join(text.replace('$', '').replace(',', '').split())
+
 
 class DataCleaner:
     """Utilities for cleaning and validating scraped data."""
@@ -23,7 +51,7 @@ class DataCleaner:
             return None
 
         # Remove currency symbols, commas, and whitespace
-        cleaned = re.sub(r'[$,\s]', '', str(price_text))
+        cleaned = _strip_price_text(str(price_text))
 
         try:
             return float(cleaned)
@@ -45,7 +73,7 @@ class DataCleaner:
             return None
 
         # Extract first number that looks like a rating
-        match = re.search(r'(\d+\.?\d*)', str(rating_text))
+        match = _RATING_RE.search(str(rating_text))
         if match:
             try:
                 rating = float(match.group(1))
@@ -69,7 +97,7 @@ class DataCleaner:
             return 0
 
         # Extract number from text
-        match = re.search(r'(\d+)', str(review_text))
+        match = _INT_RE.search(str(review_text))
         if match:
             try:
                 return int(match.group(1))
@@ -110,7 +138,7 @@ class DataCleaner:
             return ""
 
         # Remove extra whitespace and newlines
-        cleaned = re.sub(r'\s+', ' ', str(text))
+        cleaned = _WHITESPACE_RE.sub(' ', str(text))
         return cleaned.strip()
 
     @staticmethod
@@ -129,18 +157,21 @@ class DataCleaner:
 
         # Model numbers typically have letters and numbers
         # Examples: WDT780SAEM1, RF28R7351SR, GNE27JSMSS
-        match = re.search(r'[A-Z]{2,}[\w\d-]+', str(text).upper())
+        match = _MODEL_NUMBER_RE.search(str(text).upper())
         if match:
             return match.group(0)
         return None
 
     @staticmethod
+    @lru_cache(maxsize=URL_CACHE_SIZE)
     def is_valid_url(url: str) -> bool:
         """
         Check if URL is valid.
 
+        Results are cached, since the same URLs recur across a scrape.
+
         Args:
-            url: URL to validate
+            url: URL to validate (must be hashable)
 
         Returns:
             True if valid, False otherwise
@@ -148,23 +179,18 @@ class DataCleaner:
         if not url:
             return False
 
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain
-            r'localhost|'  # localhost
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or IP
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-
-        return bool(url_pattern.match(url))
+        return bool(_URL_RE.match(url))
 
     @staticmethod
+    @lru_cache(maxsize=APPLIANCE_TYPE_CACHE_SIZE)
     def normalize_appliance_type(appliance_type: str) -> str:
         """
         Normalize appliance type to lowercase standard values.
 
+        Results are cached: a run only sees a handful of distinct values.
+
         Args:
-            appliance_type: Raw appliance type
+            appliance_type: Raw appliance type (must be hashable)
 
         Returns:
             'refrigerator' or 'dishwasher'